@@ -3,20 +3,36 @@ version_forge: Semantic versioning with cross-component compatibility enforcemen
 
 A modular toolkit for managing version information, compatibility checking,
 and automatic version updates across codebases and components.
+
+Public symbols are resolved lazily on first attribute access (PEP 562), so
+``import version_forge`` only pays for the subpackages a caller actually uses.
+``cli`` is the exception: it shares its name with the ``cli`` subpackage, which
+the import system binds over any lazy lookup, so it is bound eagerly (the CLI
+module imports only the standard library at load time).
 """
+from importlib import import_module
+from typing import Any, Dict, Final, List, Tuple
+
 from .cli import main as cli
-from .compatibility.matrix import CompatibilityMatrix
-from .compatibility.validator import DependencyValidator
-from .core.config import VersionConfig
-from .core.version import (DEFAULT_VERSION, SimpleVersion, format_version,
-                           parse_version)
-from .operations.compare import calculate_delta, is_compatible
-from .operations.migration import MigrationGuideGenerator
-from .operations.update import update_version
 
 # Version of the version_forge itself
 __version__ = "3.14.7"
 
+# Public name → (module, attribute) for deferred resolution
+_LAZY_EXPORTS: Final[Dict[str, Tuple[str, str]]] = {
+    "SimpleVersion": (".core.version", "SimpleVersion"),
+    "parse_version": (".core.version", "parse_version"),
+    "format_version": (".core.version", "format_version"),
+    "DEFAULT_VERSION": (".core.version", "DEFAULT_VERSION"),
+    "VersionConfig": (".core.config", "VersionConfig"),
+    "CompatibilityMatrix": (".compatibility.matrix", "CompatibilityMatrix"),
+    "DependencyValidator": (".compatibility.validator", "DependencyValidator"),
+    "calculate_delta": (".operations.compare", "calculate_delta"),
+    "is_compatible": (".operations.compare", "is_compatible"),
+    "update_version": (".operations.update", "update_version"),
+    "MigrationGuideGenerator": (".operations.migration", "MigrationGuideGenerator"),
+}
+
 # Public API
 __all__ = [
     "SimpleVersion",
@@ -32,3 +48,18 @@ __all__ = [
     "MigrationGuideGenerator",
     "cli"
 ]
+
+def __getattr__(name: str) -> Any:
+    """Resolve public symbols on first access and cache them in module globals."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value  # Subsequent lookups bypass __getattr__ entirely
+    return value
+
+def __dir__() -> List[str]:
+    """Expose lazy exports to introspection and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -7,21 +7,31 @@ with recursive validation, dependency checking, and type-safe operations.
 import argparse
 import json
 import logging
+import operator
+import os
+import re
 import sys
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import (Any, Callable, Dict, Final, List, Protocol, Tuple, TypeVar,
-                    cast)
-
-from ..compatibility.validator import DependencyValidator
-from ..core.config import VersionConfig
-from ..core.version import SimpleVersion, format_version
-from ..operations.compare import (calculate_delta, calculate_version_delta,
-                                  is_compatible)
-from ..operations.migration import MigrationGuideGenerator
-from ..operations.update import CompleteVersionUpdateResult, update_version
-from ..protocols.interfaces import VersionDelta
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Final, Iterator, List,
+                    Literal, Optional, Protocol, Tuple, TypeVar, cast,
+                    runtime_checkable)
+
+# Heavy subpackages are imported inside the handlers that need them so that
+# `--help` and argument errors never load the compatibility/operations trees
+if TYPE_CHECKING:
+    from ..compatibility.validator import DependencyValidator
+    from ..core.config import VersionConfig
+    from ..core.version import SimpleVersion
+    from ..operations.update import CompleteVersionUpdateResult
+    from ..protocols.interfaces import VersionDelta
+
+# Optional accelerated JSON decoding - stdlib json accepts the same bytes input
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads  # type: ignore[assignment]
 
 # Type definitions for enhanced precision
 T = TypeVar('T')
@@ -38,20 +48,43 @@ EMOJI_UP: Final[str] = "🔼"
 EMOJI_DOWN: Final[str] = "🔽"
 EMOJI_SAME: Final[str] = "⏸️"
 
+# Delta rendering: display labels precomputed, "{:+d}" supplies the sign
+_COMPONENT_LABELS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("major", "Major"), ("minor", "Minor"), ("patch", "Patch"),
+)
+_DELTA_FMT: Final[str] = "{}: {:+d}"
+
+# Compare output: (direction, change type) → expected impact
+_CHANGE_IMPACT: Final[Dict[Tuple[str, str], str]] = {
+    ("Upgrade", "Major"): "expect breaking changes",
+    ("Upgrade", "Minor"): "new features",
+    ("Upgrade", "Patch"): "bug fixes",
+    ("Downgrade", "Major"): "significant rollback",
+    ("Downgrade", "Minor"): "feature removal",
+    ("Downgrade", "Patch"): "reverting fixes",
+}
+
 logger: logging.Logger = logging.getLogger("forge.version")
 
 # Function decorator for timing and logging execution
 def time_execution(func: Callable[..., T]) -> Callable[..., T]:
-    """Measure execution time for performance analysis."""
+    """Measure execution time for performance analysis when debug logging is on."""
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        start = time.time()
+        # Level is decided at call time, after setup_logging has configured it
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        start = time.perf_counter()
         try:
             return func(*args, **kwargs)
         finally:
-            logger.debug("%s executed in %.3fs", func.__name__, time.time() - start)
+            logger.debug("%s executed in %.3fs", func.__name__, time.perf_counter() - start)
     return wrapper
 
+def _write_lines(lines: List[str]) -> None:
+    """Emit buffered command output with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def setup_logging(debug: bool = False) -> None:
     """Configure logging with appropriate verbosity and type-aware formatting."""
     level: int = logging.DEBUG if debug else logging.INFO
@@ -63,17 +96,31 @@ def setup_logging(debug: bool = False) -> None:
     logging.basicConfig(level=level, format=format_string)
     logger.debug("Logging initialized with debug mode: %s", "enabled" if debug else "disabled")
 
+@lru_cache(maxsize=1)
+def _get_config() -> "VersionConfig":
+    """Shared read-only configuration for command handlers (``cache_clear()`` resets)."""
+    from ..core.config import VersionConfig
+    return VersionConfig()
+
+@lru_cache(maxsize=4096)
+def _parse_simple_version(version_str: str) -> "SimpleVersion":
+    """Parse once per distinct version string; callers must not mutate the result."""
+    from ..core.version import SimpleVersion
+    return SimpleVersion(version_str)
+
 def get_version_command(args: argparse.Namespace) -> int:
     """
     Display current version information with fractal completeness.
 
     Shows structured version data with expanding detail based on verbosity.
     """
-    config = VersionConfig()
+    from ..core.version import format_version
+
+    config = _get_config()
     formatted: str = format_version(config.__version__)
 
-    # Basic version display with elegant framing
-    print(f"{formatted} {'(' + config.source + ')' if args.verbose else ''}")
+    # Basic version display with elegant framing - buffered into a single write
+    out: List[str] = [f"{formatted} {'(' + config.source + ')' if args.verbose else ''}"]
 
     if args.verbose:
         # Display structured information with visual boundaries for clarity
@@ -86,12 +133,16 @@ def get_version_command(args: argparse.Namespace) -> int:
             ("Source", config.source)
         ]
 
-        width = max(len(name) + len(str(value)) for name, value in fields) + 10
-        print(f"\n┌{'─' * width}┐")
-        for name, value in fields:
-            print(f"│ {name}:{' ' * (width - len(name) - len(str(value)) - 4)}{value} │")
-        print(f"└{'─' * width}┘")
+        # Stringify each value once for both width calculation and rendering
+        rows = [(name, str(value)) for name, value in fields]
+        width = max(len(name) + len(value) for name, value in rows) + 10
+        hrule = '─' * width
+        out.append(f"\n┌{hrule}┐")
+        # Right-align each value in the space left after its label
+        out.extend(f"│ {name}:{value:>{width - len(name) - 4}} │" for name, value in rows)
+        out.append(f"└{hrule}┘")
 
+    _write_lines(out)
     return 0
 
 def check_version_command(args: argparse.Namespace) -> int:
@@ -105,22 +156,26 @@ def check_version_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Version argument is required")
         return 1
 
-    config = VersionConfig()
-    is_valid: bool = is_compatible(args.version, config.min_version)
-    delta: VersionDelta = calculate_delta(args.version, config.min_version)
+    from ..core.version import parse_version
+    from ..operations.compare import (calculate_delta_parsed,
+                                      is_compatible_parsed)
+
+    config = _get_config()
+    # Parse each side once and share it between the compatibility and delta checks
+    version = parse_version(args.version)
+    minimum = parse_version(config.min_version)
+    is_valid: bool = is_compatible_parsed(version, minimum)
+    delta: VersionDelta = calculate_delta_parsed(version, minimum)
+    major, minor, patch = delta.get("major", 0), delta.get("minor", 0), delta.get("patch", 0)
 
     if is_valid:
         print(f"{EMOJI_SUCCESS} Version {args.version} is compatible with minimum {config.min_version}")
 
         # Show upgrade margin when compatible
         if not delta.get("is_same", False):
-            margin = []
-            if delta.get("major", 0) > 0:
-                margin.append(f"{delta.get('major')} major")
-            if delta.get("minor", 0) > 0:
-                margin.append(f"{delta.get('minor')} minor")
-            if delta.get("patch", 0) > 0:
-                margin.append(f"{delta.get('patch')} patch")
+            margin = [f"{value} {label}"
+                      for value, label in ((major, "major"), (minor, "minor"), (patch, "patch"))
+                      if value > 0]
 
             print(f"  {EMOJI_UP} Version is ahead by {', '.join(margin)}")
     else:
@@ -128,13 +183,11 @@ def check_version_command(args: argparse.Namespace) -> int:
 
         # Provide helpful context on version delta for debugging
         if delta.get("is_downgrade", False):
-            behind_parts = []
-            if abs(delta.get("major", 0)) > 0:
-                behind_parts.append(f"{abs(delta.get('major', 0))} major")
-            if abs(delta.get("minor", 0)) > 0:
-                behind_parts.append(f"{abs(delta.get('minor', 0))} minor")
-            if abs(delta.get("patch", 0)) > 0:
-                behind_parts.append(f"{abs(delta.get('patch', 0))} patch")
+            # abs() evaluated once per component, shared by the test and the label
+            behind_parts = [f"{value} {label}"
+                            for value, label in ((abs(major), "major"), (abs(minor), "minor"),
+                                                 (abs(patch), "patch"))
+                            if value]
 
             print(f"  {EMOJI_DOWN} Version is behind by {', '.join(behind_parts)}")
             print(f"  Suggestion: Update to at least {config.min_version}")
@@ -153,12 +206,14 @@ def update_version_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Version argument is required")
         return 1
 
-    config = VersionConfig()
+    from ..operations.update import update_version
+
+    config = _get_config()
     current_version: str = config.__version__
 
     try:
         # Validate version format with improved type safety
-        version_obj = SimpleVersion(args.version)
+        version_obj = _parse_simple_version(args.version)
 
         # Version validation in one concise check
         if not all(hasattr(version_obj, attr) for attr in ('major', 'minor', 'patch')):
@@ -172,32 +227,36 @@ def update_version_command(args: argparse.Namespace) -> int:
             Path(args.repo) if args.repo else None,
         )
 
+        # Report buffered into a single write - file lists can run to hundreds of lines
+        files_changed: List[str] = result["files_changed"]
         if result["updated"]:
-            file_count: int = len(result["files_changed"])
-            print(f"{EMOJI_SUCCESS} Updated {file_count} file{'s' if file_count != 1 else ''} "
-                  f"from {result['previous_version']} → {result['current_version']}")
-            print(f"   Duration: {result['duration_seconds']:.2f}s")
+            file_count: int = len(files_changed)
+            out: List[str] = [
+                f"{EMOJI_SUCCESS} Updated {file_count} file{'s' if file_count != 1 else ''} "
+                f"from {result['previous_version']} → {result['current_version']}",
+                f"   Duration: {result['duration_seconds']:.2f}s",
+            ]
 
-            if args.verbose and result["files_changed"]:
-                print("\nFiles changed:")
-                for file in sorted(result["files_changed"]):
-                    print(f"  - {file}")
+            if args.verbose and files_changed:
+                out.append("\nFiles changed:")
+                out.extend(f"  - {file}" for file in sorted(files_changed))
 
             if args.verbose:
                 # Provide detailed statistics
                 examined: int = max(1, result["files_examined"])  # Prevent division by zero
-                efficiency: float = len(result["files_changed"]) / examined * 100
-                print(f"\nScanning efficiency: {len(result['files_changed'])}/{result['files_examined']} "
-                      f"({efficiency:.1f}%)")
+                efficiency: float = file_count / examined * 100
+                out.append(f"\nScanning efficiency: {file_count}/{result['files_examined']} "
+                           f"({efficiency:.1f}%)")
 
                 # Add witty efficiency comment
                 if efficiency < 10:
-                    print("  Looking for versions like finding needles in a haystack factory.")
+                    out.append("  Looking for versions like finding needles in a haystack factory.")
                 elif efficiency > 50:
-                    print("  Impressive hit rate! Your versioning is well-organized.")
+                    out.append("  Impressive hit rate! Your versioning is well-organized.")
         else:
-            print(f"{EMOJI_INFO} No changes needed for version {result['current_version']}")
+            out = [f"{EMOJI_INFO} No changes needed for version {result['current_version']}"]
 
+        _write_lines(out)
         return 0
     except Exception as e:
         print(f"{EMOJI_ERROR} Error updating version: {e}")
@@ -215,61 +274,55 @@ def compare_versions_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Both version arguments are required")
         return 1
 
+    from ..operations.compare import calculate_version_delta
+
     try:
         # Use the semantic version delta calculator
         delta: VersionDelta = calculate_version_delta(args.version1, args.version2)
+        major, minor = delta.get("major", 0), delta.get("minor", 0)
+        is_upgrade, is_downgrade = delta.get("is_upgrade", False), delta.get("is_downgrade", False)
 
-        # Output with visual structure
-        print(f"{EMOJI_CHART} {args.version1} → {args.version2}")
+        # Output with visual structure - buffered into a single write
+        out: List[str] = [f"{EMOJI_CHART} {args.version1} → {args.version2}"]
 
         # Delta components with sign-awareness for clearer representation
         parts = []
-        for component in ("major", "minor", "patch"):
+        for component, label in _COMPONENT_LABELS:
             value = delta.get(component, 0)
-            if value != 0:
-                parts.append(f"{component.capitalize()}: {'+' if value > 0 else ''}{value}")
-
-        print("  " + (", ".join(parts) if parts else "No version difference"))
-
-        # Semantic categorization with visual indicators
-        if delta.get("is_upgrade", False):
-            change_type = "Major" if delta.get("major", 0) > 0 else "Minor" if delta.get("minor", 0) > 0 else "Patch"
-            impact = {
-                "Major": "expect breaking changes",
-                "Minor": "new features",
-                "Patch": "bug fixes"
-            }
-            print(f"  {EMOJI_UP} Upgrade ({change_type} - {impact[change_type]})")
-
-        elif delta.get("is_downgrade", False):
-            change_type = "Major" if delta.get("major", 0) < 0 else "Minor" if delta.get("minor", 0) < 0 else "Patch"
-            impact = {
-                "Major": "significant rollback",
-                "Minor": "feature removal",
-                "Patch": "reverting fixes"
-            }
-            print(f"  {EMOJI_DOWN} Downgrade ({change_type} - {impact[change_type]})")
+            if value:
+                parts.append(_DELTA_FMT.format(label, value))
+
+        out.append("  " + (", ".join(parts) if parts else "No version difference"))
+
+        # Semantic categorization with visual indicators - one table lookup
+        if is_upgrade or is_downgrade:
+            direction = "Upgrade" if is_upgrade else "Downgrade"
+            sign = 1 if is_upgrade else -1  # Orient deltas so the change direction is positive
+            change_type = "Major" if major * sign > 0 else "Minor" if minor * sign > 0 else "Patch"
+            emoji = EMOJI_UP if is_upgrade else EMOJI_DOWN
+            out.append(f"  {emoji} {direction} ({change_type} - {_CHANGE_IMPACT[direction, change_type]})")
 
         elif delta.get("is_same", False):
-            print(f"  {EMOJI_SAME} Equivalent versions")
+            out.append(f"  {EMOJI_SAME} Equivalent versions")
 
         if args.verbose:
             # Migration path suggestion for smart upgrades
-            print("\nSuggested migration path:")
-            if delta.get("major", 0) > 0:
-                print("  • Review breaking changes in documentation")
-                print("  • Update dependencies before upgrading")
-                print("  • Consider incremental updates through minor versions")
-            elif delta.get("minor", 0) > 0:
-                if delta.get("minor", 0) > 3:
-                    print("  • Test new features incrementally")
-                    print("  • Review deprecation notices")
+            out.append("\nSuggested migration path:")
+            if major > 0:
+                out.append("  • Review breaking changes in documentation")
+                out.append("  • Update dependencies before upgrading")
+                out.append("  • Consider incremental updates through minor versions")
+            elif minor > 0:
+                if minor > 3:
+                    out.append("  • Test new features incrementally")
+                    out.append("  • Review deprecation notices")
                 else:
-                    print("  • Update with standard testing procedures")
-            elif delta.get("is_downgrade", False) and delta.get("major", 0) < 0:
-                print("  • Caution: Major downgrade may result in lost functionality")
-                print("  • Create compatibility layer for dependent systems")
+                    out.append("  • Update with standard testing procedures")
+            elif is_downgrade and major < 0:
+                out.append("  • Caution: Major downgrade may result in lost functionality")
+                out.append("  • Create compatibility layer for dependent systems")
 
+        _write_lines(out)
         return 0
 
     except Exception as e:
@@ -277,8 +330,14 @@ def compare_versions_command(args: argparse.Namespace) -> int:
         logger.exception("Version comparison failed")
         return 1
 
+@runtime_checkable
 class VersionLike(Protocol):
-    """Protocol for objects with semantic version components."""
+    """Protocol for objects with semantic version components.
+
+    Runtime-checkable for callers that want an isinstance() gate; the
+    VersionWrapper comparisons stay on EAFP attribute access, which is cheaper
+    than the per-attribute probing isinstance() performs on protocols.
+    """
     major: int
     minor: int
     patch: int
@@ -291,6 +350,9 @@ class VersionWrapper:
     comparable interface and standardized access patterns.
     """
 
+    # No per-instance __dict__ - components files can hold hundreds of entries
+    __slots__ = ("_version_str", "_version_object", "version_info", "_key")
+
     def __init__(self, ver_data: Dict[str, Any]) -> None:
         """Initialize with component version data dictionary.
 
@@ -298,113 +360,221 @@ class VersionWrapper:
             ver_data: Component metadata including version information
         """
         version_str = ver_data.get("version", "0.1.0")
-        # Parse string into proper version object
-        self._version_object = SimpleVersion(version_str)
+        self._version_str = version_str
+        self._version_object: Optional["SimpleVersion"] = None  # Built on first .version access
         self.version_info = ver_data
+        # Ordering key computed once - every comparison is a single tuple compare
+        self._key: Tuple[int, int, int] = self._split_key(version_str)
+
+    @classmethod
+    def _split_key(cls, version_str: str) -> Tuple[int, int, int]:
+        """Extract the (major, minor, patch) triple without building a version object.
+
+        Plain X.Y.Z[-pre][+build] strings are split directly; anything else
+        defers to the SimpleVersion parser so the key matches it exactly.
+        """
+        parts = version_str.split("-", 1)[0].split("+", 1)[0].split(".", 3)
+        if len(parts) >= 3 and parts[0].isdecimal() and parts[1].isdecimal() and parts[2].isdecimal():
+            return int(parts[0]), int(parts[1]), int(parts[2])
+        return cls._triple(_parse_simple_version(version_str))
 
     @property
-    def version(self) -> SimpleVersion:
+    def version(self) -> "SimpleVersion":
         """Version object implementing required version protocol."""
+        if self._version_object is None:
+            self._version_object = _parse_simple_version(self._version_str)
         return self._version_object
 
     @property
     def major(self) -> int:
         """Major version component."""
-        return self._version_object.major
+        return self._key[0]
 
     @property
     def minor(self) -> int:
         """Minor version component."""
-        return self._version_object.minor
+        return self._key[1]
 
     @property
     def patch(self) -> int:
         """Patch version component."""
-        return self._version_object.patch
+        return self._key[2]
+
+    # Single traversal of the VersionLike triple for foreign version objects
+    _triple = operator.attrgetter("major", "minor", "patch")
+
+    def _key_of(self, other: object) -> Optional[Tuple[int, int, int]]:
+        """Ordering key of another wrapper or VersionLike object, None if it has none."""
+        if isinstance(other, VersionWrapper):
+            return other._key  # Monomorphic fast path
+        try:
+            return self._triple(other)
+        except AttributeError:
+            return None
 
     def __eq__(self, other: object) -> bool:
-        """Compare versions for equality."""
-        if not hasattr(other, 'major') or not hasattr(other, 'minor') or not hasattr(other, 'patch'):
-            return NotImplemented
-
-        versioned_other = cast(VersionLike, other)
-        return (self.major == versioned_other.major and
-                self.minor == versioned_other.minor and
-                self.patch == versioned_other.patch)
+        """Compare versions for equality - defined among wrappers only, matching __hash__."""
+        if isinstance(other, VersionWrapper):
+            return self._key == other._key
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash on the ordering key so wrappers can serve as dictionary keys."""
+        return hash(self._key)
+
+    # Ordering accepts any VersionLike: major first, then minor, then patch
     def __lt__(self, other: object) -> bool:
-        """Compare versions for ordering."""
-        if not hasattr(other, 'major') or not hasattr(other, 'minor') or not hasattr(other, 'patch'):
-            return NotImplemented
-
-        # Compare major first, then minor, then patch
-        versioned_other = cast(VersionLike, other)
-        if self.major != versioned_other.major:
-            return self.major < versioned_other.major
-        if self.minor != versioned_other.minor:
-            return self.minor < versioned_other.minor
-        return self.patch < versioned_other.patch
-
-        # Compare major first, then minor, then patch
-        if self.major != other.major:
-            return self.major < other.major
-        if self.minor != other.minor:
-            return self.minor < other.minor
-        return self.patch < other.patch
-
-def _load_components_from_file(validator: DependencyValidator, file_path: Path) -> CommandResult:
+        key = self._key_of(other)
+        return NotImplemented if key is None else self._key < key
+
+    def __le__(self, other: object) -> bool:
+        key = self._key_of(other)
+        return NotImplemented if key is None else self._key <= key
+
+    def __gt__(self, other: object) -> bool:
+        key = self._key_of(other)
+        return NotImplemented if key is None else self._key > key
+
+    def __ge__(self, other: object) -> bool:
+        key = self._key_of(other)
+        return NotImplemented if key is None else self._key >= key
+
+@lru_cache(maxsize=32)
+def _read_components(path: str, mtime_ns: int, size: int) -> Tuple[
+        Tuple[Tuple[str, VersionWrapper], ...], Tuple[Tuple[str, str], ...], int]:
+    """Parse a components file into immutable registration data.
+
+    mtime_ns and size only key the cache, so an edited file is parsed again.
+    Returns (components, dependency pairs, raw dependency entry count).
+    """
+    with open(path, "rb") as f:
+        component_data = json_loads(f.read())
+
+    components = component_data.get("components", {})
+    dependencies = component_data.get("dependencies", [])
+    return (
+        tuple((name, VersionWrapper(data)) for name, data in components.items()),
+        tuple((dep["from"], dep["to"]) for dep in dependencies if "from" in dep and "to" in dep),
+        len(dependencies),
+    )
+
+def _load_components_from_file(validator: "DependencyValidator", file_path: Path) -> CommandResult:
     """Load component definitions from JSON file."""
     try:
-        with open(file_path) as f:
-            component_data = json.load(f)
-
-        # Register components with proper typing
-        for name, data in component_data.get("components", {}).items():
-            validator.register_component(name, VersionWrapper(data))
+        stat = file_path.stat()
+        components, relationships, dependency_count = _read_components(
+            os.fspath(file_path), stat.st_mtime_ns, stat.st_size
+        )
 
-        # Register dependencies
-        for dep in component_data.get("dependencies", []):
-            if "from" in dep and "to" in dep:
-                validator.register_dependency(dep["from"], dep["to"])
-                logger.debug("Registered dependency: %s → %s", dep["from"], dep["to"])
+        # Register components and dependencies in bulk with proper typing
+        validator.register_components(dict(components))
+        validator.register_dependencies(relationships)
 
-        return True, f"Loaded {len(component_data.get('components', {}))} components and {len(component_data.get('dependencies', []))} dependencies"
+        return True, f"Loaded {len(components)} components and {dependency_count} dependencies"
     except (json.JSONDecodeError, KeyError) as e:
         return False, f"Invalid components file format: {e}"
     except Exception as e:
         return False, f"Failed to load components: {e}"
 
-def _scan_directory_for_components(validator: DependencyValidator, scan_dir: Path) -> CommandResult:
-    """Scan directory for components and dependencies."""
+def _iter_files(root: str) -> Iterator["os.DirEntry[str]"]:
+    """Yield file entries beneath root with one scandir per directory (no symlink descent)."""
+    pending: List[str] = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            scanner = os.scandir(directory)
+        except OSError as e:
+            # Unreadable subtrees are skipped, as the glob-based scan always did
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
+            continue
+        with scanner as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    yield entry
+
+def _read_scan_baseline(lockfile: Path) -> Optional[float]:
+    """Return the previous scan's start time, or None to force a full scan."""
+    try:
+        return float(json_loads(lockfile.read_bytes())["generated_at"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable scan lockfile %s: %s", lockfile, e)
+        return None
+
+def _write_scan_baseline(lockfile: Path, generated_at: float) -> None:
+    """Persist the scan start time so the next run only revisits newer files."""
+    try:
+        lockfile.write_text(json.dumps({"generated_at": generated_at}))
+    except OSError as e:
+        logger.warning("Failed to write scan lockfile %s: %s", lockfile, e)
+
+# Candidate component files by name - the matching group name is the target kind
+_SCAN_CLASSIFIER: Final["re.Pattern[str]"] = re.compile(
+    r"(?P<pkg>package\.json)|(?P<py>__init__\.py|version.*\.py)", re.DOTALL)
+
+def _iter_scan_targets(root: str, baseline_mtime: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+    """Lazily yield ("py" | "pkg", path) for candidate component files beneath root.
+
+    When baseline_mtime is given, files not modified after it are skipped.
+    """
+    classify = _SCAN_CLASSIFIER.fullmatch
+    for entry in _iter_files(root):
+        match = classify(entry.name)
+        if match is None:
+            continue
+        # Exactly one named alternative matched, so lastgroup is always set
+        kind = cast(str, match.lastgroup)
+
+        # Incremental mode: one stat per candidate, unchanged files are skipped
+        if baseline_mtime is not None:
+            try:
+                if entry.stat().st_mtime <= baseline_mtime:
+                    continue
+            except OSError as e:
+                logger.warning("Failed to stat %s: %s", entry.path, e)
+                continue
+        yield kind, entry.path
+
+def _scan_directory_for_components(validator: "DependencyValidator", scan_dir: Path,
+                                   baseline_mtime: Optional[float] = None) -> CommandResult:
+    """Scan directory for components and dependencies.
+
+    When baseline_mtime is given, files not modified after it are skipped.
+    """
     components_found = 0
     dependencies_found = 0
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-    # Look for version markers in files
-    version_patterns = list(scan_dir.glob("**/version*.py"))
-    init_patterns = list(scan_dir.glob("**/__init__.py"))
-    package_patterns = list(scan_dir.glob("**/package.json"))
-
-    # Extract version info from Python files
-    for file_path in version_patterns + init_patterns:
-        try:
+    # One walk, each candidate handled as it is found - paths stay plain strings
+    for kind, file_path in _iter_scan_targets(os.fspath(scan_dir), baseline_mtime):
+        if kind == "py":
             # Simple regex-based version extraction would be implemented here
             # For now, we just note the potential component
-            logger.debug("Found potential component at: %s", file_path.parent)
+            if debug_enabled:
+                logger.debug("Found potential component at: %s", os.path.dirname(file_path))
             components_found += 1
-        except Exception as e:
-            logger.warning("Failed to process %s: %s", file_path, e)
+            continue
 
-    # Extract from package.json files
-    for file_path in package_patterns:
         try:
-            with open(file_path) as f:
-                pkg_data = json.load(f)
-                if "dependencies" in pkg_data:
-                    dependencies_found += len(pkg_data["dependencies"])
-                    # Would register dependencies here in a complete implementation
+            # Only the top-level dependencies mapping is needed from each manifest;
+            # a byte probe skips parsing manifests that cannot contain one
+            with open(file_path, "rb") as f:
+                data = f.read()
+            if b'"dependencies"' not in data:
+                continue
+            dependencies = json_loads(data).get("dependencies")
+            if dependencies is not None:
+                dependencies_found += len(dependencies)
+                # Would register dependencies here in a complete implementation
         except Exception as e:
             logger.warning("Failed to process %s: %s", file_path, e)
 
     if components_found == 0:
+        if baseline_mtime is not None:
+            return True, "No component files changed since the last scan"
         return False, "No components found in directory scan"
 
     return True, f"Found {components_found} potential components and {dependencies_found} dependencies"
@@ -416,6 +586,8 @@ def validate_command(args: argparse.Namespace) -> int:
     Performs topological analysis of dependency graphs to ensure version
     compatibility across the Eidosian ecosystem with elegant error reporting.
     """
+    from ..compatibility.validator import DependencyValidator
+
     validator = DependencyValidator()
 
     # Handle component loading from different sources
@@ -438,8 +610,14 @@ def validate_command(args: argparse.Namespace) -> int:
             print(f"{EMOJI_ERROR} Invalid scan directory: {scan_dir}")
             return 1
 
+        lockfile = Path(args.since_lockfile) if args.since_lockfile else None
+        baseline = _read_scan_baseline(lockfile) if lockfile else None
+        scan_started = time.time()  # Wall clock - compared against file mtimes
+
         print(f"{EMOJI_INFO} Scanning {scan_dir} for components...")
-        success, message = _scan_directory_for_components(validator, scan_dir)
+        success, message = _scan_directory_for_components(validator, scan_dir, baseline)
+        if lockfile:
+            _write_scan_baseline(lockfile, scan_started)
         print(f"{EMOJI_INFO if success else EMOJI_WARNING} {message}")
 
         if not success:
@@ -462,7 +640,7 @@ def validate_command(args: argparse.Namespace) -> int:
         if args.fix and args.target_versions:
             # Try to generate upgrade plan
             try:
-                target_versions = json.loads(args.target_versions)
+                target_versions = json_loads(args.target_versions)
                 plan = validator.get_upgrade_plan(target_versions)
 
                 if plan:
@@ -476,6 +654,23 @@ def validate_command(args: argparse.Namespace) -> int:
 
         return 1
 
+# List-valued MigrationGuide keys - literal so indexing the TypedDict stays type-checked
+_GuideListKey = Literal["breaking_changes", "new_features", "deprecations", "suggestions"]
+
+# Migration guide sections in order of importance: (heading, guide key)
+_GUIDE_SECTIONS: Final[Tuple[Tuple[str, _GuideListKey], ...]] = (
+    ("🚨 Breaking Changes", "breaking_changes"),
+    ("✨ New Features", "new_features"),
+    ("⚠️ Deprecations", "deprecations"),
+    ("💡 Suggestions", "suggestions"),
+)
+
+def _append_section(out: List[str], title: str, items: List[str]) -> None:
+    """Buffer a section of the migration guide with consistent formatting."""
+    if items:
+        out.append(f"\n{title}:")
+        out.extend(f"  • {item}" for item in items)
+
 @time_execution
 def migration_guide_command(args: argparse.Namespace) -> int:
     """
@@ -488,6 +683,8 @@ def migration_guide_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Component name, from-version and to-version are required")
         return 1
 
+    from ..operations.migration import MigrationGuideGenerator
+
     try:
         # Initialize migration guide generator
         generator = MigrationGuideGenerator()
@@ -499,28 +696,19 @@ def migration_guide_command(args: argparse.Namespace) -> int:
             args.to_version
         )
 
-        # Output with visual structure - aligned for readability
-        print(f"🧭 Migration Guide: {args.component}")
-        print(f"  From: {guide['from_version']} → To: {guide['to_version']}")
-        print(f"  Type: {guide['upgrade_type'].upper()}")
-        print(f"  Effort: {guide['estimated_effort'].upper()}")
+        # Output with visual structure - aligned for readability, buffered into a single write
+        out: List[str] = [
+            f"🧭 Migration Guide: {args.component}",
+            f"  From: {guide['from_version']} → To: {guide['to_version']}",
+            f"  Type: {guide['upgrade_type'].upper()}",
+            f"  Effort: {guide['estimated_effort'].upper()}",
+        ]
 
         # Display detailed sections with elegant framing
-        def print_section(title: str, items: List[str]) -> None:
-            """Print a section of the migration guide with consistent formatting."""
-            if not items:
-                return
-
-            print(f"\n{title}:")
-            for item in items:
-                print(f"  • {item}")
-
-        # Order sections by importance
-        print_section("🚨 Breaking Changes", guide["breaking_changes"])
-        print_section("✨ New Features", guide["new_features"])
-        print_section("⚠️ Deprecations", guide["deprecations"])
-        print_section("💡 Suggestions", guide["suggestions"])
+        for title, key in _GUIDE_SECTIONS:
+            _append_section(out, title, guide[key])
 
+        _write_lines(out)
         return 0
 
     except Exception as e:
@@ -528,65 +716,102 @@ def migration_guide_command(args: argparse.Namespace) -> int:
         logger.exception("Migration guide generation failed")
         return 1
 
-def parse_args() -> argparse.Namespace:
-    """
-    Parse command line arguments with elegant structure and clear intentions.
-
-    Creates a seamless command interface with intelligent grouping and
-    contextually relevant parameter validation.
-    """
-    parser = argparse.ArgumentParser(
-        description="Eidosian version management and compatibility toolkit",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-┌──────────────────────────────────────────────┐
-│ Examples:                                    │
-│   version_forge get -v                       │
-│   version_forge update 1.2.3                 │
-│   version_forge compare 1.0.0 2.0.0          │
-│   version_forge validate --components-file... │
-└──────────────────────────────────────────────┘
-        """
-    )
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+# argparse._SubParsersAction is private API, so builders accept it loosely
+SubParsers = Any
 
-    # Get version command
+def _build_get_parser(subparsers: SubParsers) -> None:
     get_parser = subparsers.add_parser("get", help="Display current version")
+    get_parser.set_defaults(func=get_version_command)
     get_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed information")
 
-    # Check version command
+def _build_check_parser(subparsers: SubParsers) -> None:
     check_parser = subparsers.add_parser("check", help="Check version compatibility")
+    check_parser.set_defaults(func=check_version_command)
     check_parser.add_argument("version", help="Version to check against minimum")
 
-    # Update version command
+def _build_update_parser(subparsers: SubParsers) -> None:
     update_parser = subparsers.add_parser("update", help="Update version references")
+    update_parser.set_defaults(func=update_version_command)
     update_parser.add_argument("version", help="New version to set")
     update_parser.add_argument("--repo", help="Repository path to update")
     update_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output")
 
-    # Compare versions command
+def _build_compare_parser(subparsers: SubParsers) -> None:
     compare_parser = subparsers.add_parser("compare", help="Compare two versions")
+    compare_parser.set_defaults(func=compare_versions_command)
     compare_parser.add_argument("version1", help="Base version")
     compare_parser.add_argument("version2", help="Target version")
     compare_parser.add_argument("-v", "--verbose", action="store_true", help="Show migration suggestions")
 
-    # Validate dependencies command
+def _build_validate_parser(subparsers: SubParsers) -> None:
     validate_parser = subparsers.add_parser("validate", help="Validate dependency graph")
+    validate_parser.set_defaults(func=validate_command)
     validate_source = validate_parser.add_mutually_exclusive_group(required=True)
     validate_source.add_argument("--components-file", help="JSON file with component definitions")
     validate_source.add_argument("--scan-directory", help="Directory to scan for components")
     validate_parser.add_argument("--fix", action="store_true", help="Suggest fixes for validation issues")
     validate_parser.add_argument("--target-versions", help="JSON string with target versions to upgrade to")
+    validate_parser.add_argument("--since-lockfile",
+                                 help="Scan lockfile; only files modified since its last scan are rescanned")
 
-    # Migration guide command
+def _build_migrate_parser(subparsers: SubParsers) -> None:
     migrate_parser = subparsers.add_parser("migrate", help="Generate migration guide")
+    migrate_parser.set_defaults(func=migration_guide_command)
     migrate_parser.add_argument("component", help="Component name")
     migrate_parser.add_argument("from_version", help="Source version")
     migrate_parser.add_argument("to_version", help="Target version")
 
-    return parser.parse_args()
+# Subparser builders keyed by command name - only the invoked one is constructed
+SUBPARSER_BUILDERS: Final[Dict[str, Callable[[SubParsers], None]]] = {
+    "get": _build_get_parser,
+    "check": _build_check_parser,
+    "update": _build_update_parser,
+    "compare": _build_compare_parser,
+    "validate": _build_validate_parser,
+    "migrate": _build_migrate_parser,
+}
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the first positional token when it names a known command."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in SUBPARSER_BUILDERS else None
+    return None
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments with elegant structure and clear intentions.
+
+    Creates a seamless command interface with intelligent grouping and
+    contextually relevant parameter validation. Only the subparser for the
+    invoked command is built; help requests and unknown commands build all.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(
+        description="Eidosian version management and compatibility toolkit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+┌──────────────────────────────────────────────┐
+│ Examples:                                    │
+│   version_forge get -v                       │
+│   version_forge update 1.2.3                 │
+│   version_forge compare 1.0.0 2.0.0          │
+│   version_forge validate --components-file... │
+└──────────────────────────────────────────────┘
+        """
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Command to execute")
+
+    command = _sniff_subcommand(argv)
+    if command is None or "-h" in argv or "--help" in argv:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    else:
+        SUBPARSER_BUILDERS[command](subparsers)
+
+    return parser.parse_args(argv)
 
 def main() -> int:
     """
@@ -599,22 +824,10 @@ def main() -> int:
         args = parse_args()
         setup_logging(args.debug)
 
-        # Command handler mapping with precise typing
-        command_handlers: Dict[str, CommandHandler] = {
-            "get": get_version_command,
-            "check": check_version_command,
-            "update": update_version_command,
-            "compare": compare_versions_command,
-            "validate": validate_command,
-            "migrate": migration_guide_command
-        }
-
-        if args.command in command_handlers:
-            logger.debug("Executing command: %s", args.command)
-            return command_handlers[args.command](args)
-        else:
-            print(f"{EMOJI_ERROR} No command specified. Use --help for usage information.")
-            return 1
+        # argparse guarantees a command, and each subparser binds its handler
+        handler: CommandHandler = args.func
+        logger.debug("Executing command: %s", args.command)
+        return handler(args)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
         return 130  # Standard exit code for Ctrl+C
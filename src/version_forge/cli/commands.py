@@ -1,15 +1,16 @@
-import json
 import logging
+import operator
 from pathlib import Path
-from typing import Any, Dict, List, Protocol, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Protocol, Tuple
 import argparse
-from ..compatibility.validator import DependencyValidator
 from ..core.config import VersionConfig
 from ..core.version import SimpleVersion, format_version
-from ..operations.migration import MigrationGuideGenerator
-from ..operations.update import CompleteVersionUpdateResult, update_version
 from ..protocols.interfaces import VersionDelta
 
+if TYPE_CHECKING:
+    from ..compatibility.validator import DependencyValidator
+    from ..operations.update import CompleteVersionUpdateResult
+
 """
 Command implementations for version_forge CLI with robust error handling and elegant output.
 
@@ -21,7 +22,8 @@ of the version_forge CLI with a consistent interface and precise error reporting
 from ..operations.compare import (calculate_delta, calculate_version_delta,
                                  is_compatible)
 from . import (EMOJI_CHART, EMOJI_DOWN, EMOJI_ERROR, EMOJI_INFO, EMOJI_SAME,
-               EMOJI_SUCCESS, EMOJI_UP, EMOJI_WARNING, time_execution)
+               EMOJI_SUCCESS, EMOJI_UP, EMOJI_WARNING, json_loads,
+               time_execution)
 
 # Command result type for clear function intent
 CommandResult = Tuple[bool, str]
@@ -51,11 +53,14 @@ def get_version_command(args: argparse.Namespace) -> int:
             ("Source", config.source)
         ]
 
-        width = max(len(name) + len(str(value)) for name, value in fields) + 10
-        print(f"\n┌{'─' * width}┐")
-        for name, value in fields:
-            print(f"│ {name}:{' ' * (width - len(name) - len(str(value)) - 4)}{value} │")
-        print(f"└{'─' * width}┘")
+        # Stringify each value once for both width calculation and rendering
+        rows = [(name, str(value)) for name, value in fields]
+        width = max(len(name) + len(value) for name, value in rows) + 10
+        hrule = '─' * width
+        print(f"\n┌{hrule}┐")
+        for name, value in rows:
+            print(f"│ {name}:{value:>{width - len(name) - 4}} │")
+        print(f"└{hrule}┘")
 
     return 0
 
@@ -118,6 +123,8 @@ def update_version_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Version argument is required")
         return 1
 
+    from ..operations.update import update_version
+
     config = VersionConfig()
     current_version: str = config.__version__
 
@@ -192,7 +199,7 @@ def compare_versions_command(args: argparse.Namespace) -> int:
         for component in ("major", "minor", "patch"):
             value = delta.get(component, 0)
             if value != 0:
-                parts.append(f"{component.capitalize()}: {'+' if value > 0 else ''}{value}")
+                parts.append(f"{component.capitalize()}: {value:+d}")
 
         print("  " + (", ".join(parts) if parts else "No version difference"))
 
@@ -286,34 +293,31 @@ class VersionWrapper:
         """Patch version component."""
         return self._version_object.patch
 
+    # Single traversal of the VersionLike triple - no cast() call per comparison
+    _triple = operator.attrgetter("major", "minor", "patch")
+
     def __eq__(self, other: object) -> bool:
         """Compare versions for equality."""
-        if not hasattr(other, 'major') or not hasattr(other, 'minor') or not hasattr(other, 'patch'):
+        try:
+            return self._triple(self) == self._triple(other)
+        except AttributeError:
             return NotImplemented
 
-        versioned_other = cast(VersionLike, other)
-        return (self.major == versioned_other.major and
-                self.minor == versioned_other.minor and
-                self.patch == versioned_other.patch)
-
     def __lt__(self, other: object) -> bool:
-        """Compare versions for ordering."""
-        if not hasattr(other, 'major') or not hasattr(other, 'minor') or not hasattr(other, 'patch'):
+        """Compare versions for ordering: major first, then minor, then patch."""
+        try:
+            return self._triple(self) < self._triple(other)
+        except AttributeError:
             return NotImplemented
 
-        # Compare major first, then minor, then patch
-        versioned_other = cast(VersionLike, other)
-        if self.major != versioned_other.major:
-            return self.major < versioned_other.major
-        if self.minor != versioned_other.minor:
-            return self.minor < versioned_other.minor
-        return self.patch < versioned_other.patch
-
-def _load_components_from_file(validator: DependencyValidator, file_path: Path) -> CommandResult:
+def _load_components_from_file(validator: "DependencyValidator", file_path: Path) -> CommandResult:
     """Load component definitions from JSON file."""
+    import json
+
     try:
-        with open(file_path) as f:
-            component_data = json.load(f)
+        # Raw bytes straight into the shared (orjson-accelerated when available) decoder
+        with open(file_path, "rb") as f:
+            component_data = json_loads(f.read())
 
         # Register components with proper typing
         for name, data in component_data.get("components", {}).items():
@@ -331,7 +335,7 @@ def _load_components_from_file(validator: DependencyValidator, file_path: Path)
     except Exception as e:
         return False, f"Failed to load components: {e}"
 
-def _scan_directory_for_components(validator: DependencyValidator, scan_dir: Path) -> CommandResult:
+def _scan_directory_for_components(validator: "DependencyValidator", scan_dir: Path) -> CommandResult:
     """Scan directory for components and dependencies."""
     components_found = 0
     dependencies_found = 0
@@ -354,8 +358,8 @@ def _scan_directory_for_components(validator: DependencyValidator, scan_dir: Pat
     # Extract from package.json files
     for file_path in package_patterns:
         try:
-            with open(file_path) as f:
-                pkg_data = json.load(f)
+            with open(file_path, "rb") as f:
+                pkg_data = json_loads(f.read())
                 if "dependencies" in pkg_data:
                     dependencies_found += len(pkg_data["dependencies"])
                     # Would register dependencies here in a complete implementation
@@ -374,6 +378,10 @@ def validate_command(args: argparse.Namespace) -> int:
     Performs topological analysis of dependency graphs to ensure version
     compatibility across the Eidosian ecosystem with elegant error reporting.
     """
+    import json
+
+    from ..compatibility.validator import DependencyValidator
+
     validator = DependencyValidator()
 
     # Handle component loading from different sources
@@ -420,7 +428,7 @@ def validate_command(args: argparse.Namespace) -> int:
         if args.fix and args.target_versions:
             # Try to generate upgrade plan
             try:
-                target_versions = json.loads(args.target_versions)
+                target_versions = json_loads(args.target_versions)
                 plan = validator.get_upgrade_plan(target_versions)
 
                 if plan:
@@ -446,6 +454,8 @@ def migration_guide_command(args: argparse.Namespace) -> int:
         print(f"{EMOJI_ERROR} Component name, from-version and to-version are required")
         return 1
 
+    from ..operations.migration import MigrationGuideGenerator
+
     try:
         # Initialize migration guide generator
         generator = MigrationGuideGenerator()
@@ -6,13 +6,30 @@ with both programmatic and visual representations for intelligent decision makin
 """
 import json
 import logging
-from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple, cast
+import sys
+from typing import Any, Dict, Final, List, Optional, Protocol, Sequence, cast
 
 from numpy._typing import NDArray
 
 from ..operations.compare import is_compatible
 from ..protocols.interfaces import IVersioned
 
+# Optional accelerated JSON - orjson's decode error subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize with two-space indentation via orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize with two-space indentation via the standard library."""
+        return json.dumps(obj, indent=2)
+
+    _json_loads = json.loads  # type: ignore[assignment]
+
 # Type definitions for matplotlib (imported conditionally to maintain compatibility)
 FloatingArray = NDArray[Any]  # Type alias for floating-point arrays
 
@@ -38,6 +55,7 @@ class PyplotProto(Protocol):
     """Protocol defining essential pyplot functionality with maximum compatibility."""
     def figure(self, *args: Any, **kwargs: Any) -> FigureProto: ...
     def matshow(self, *args: Any, **kwargs: Any) -> AxesImageProto: ...
+    def imshow(self, *args: Any, **kwargs: Any) -> AxesImageProto: ...
     def colorbar(self, *args: Any, **kwargs: Any) -> ColorbarProto: ...
     def xticks(self, *args: Any, **kwargs: Any) -> Any: ...
     def yticks(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -48,6 +66,10 @@ class PyplotProto(Protocol):
 
 logger = logging.getLogger("forge.version")
 
+# Graphical view: beyond this many components only a sampled subset of axes is labelled
+_FULL_LABEL_LIMIT: Final[int] = 64
+_SAMPLED_TICKS: Final[int] = 16
+
 class CompatibilityMatrix:
     """
     Track and enforce cross-component version compatibility with structural precision.
@@ -59,25 +81,49 @@ class CompatibilityMatrix:
 
     def __init__(self):
         """Initialize an empty compatibility matrix with perfect symmetry."""
-        self._compatibility_map: Dict[str, Dict[str, List[Tuple[str, str]]]] = {}
-        self._versions: Dict[str, List[str]] = {}
+        # Single store, indexed by source version: component → target → version → target versions.
+        # Innermost dicts act as insertion-ordered sets (values are always None).
+        self._compatibility_map: Dict[str, Dict[str, Dict[str, Dict[str, None]]]] = {}
+        # Known versions per component, insertion-ordered set (values are always None)
+        self._versions: Dict[str, Dict[str, None]] = {}
+        # Visualization layout, recomputed only after a new component appears
+        self._sorted_components_cache: Optional[List[str]] = None
+        self._col_width_cache: Optional[int] = None
+
+    def _invalidate_layout(self) -> None:
+        """Drop cached visualization layout after the component set grows."""
+        self._sorted_components_cache = None
+        self._col_width_cache = None
+
+    @property
+    def _sorted_components(self) -> List[str]:
+        """Component names in display order, memoized until the next new component."""
+        if self._sorted_components_cache is None:
+            self._sorted_components_cache = sorted(self._compatibility_map)
+        return self._sorted_components_cache
+
+    @property
+    def _col_width(self) -> int:
+        """ASCII column width from the longest component name, memoized alongside the order."""
+        if self._col_width_cache is None:
+            self._col_width_cache = max((len(comp) for comp in self._sorted_components), default=0) + 2
+        return self._col_width_cache
 
     def register_component(self, name: str, component: IVersioned) -> None:
         """Register a component's version information with graceful fallbacks."""
+        name = sys.intern(name)  # Names are probed as dict keys constantly
         version_str = str(component.version)
         # Handle possible absence of min_version in the IVersioned protocol
         min_version = getattr(component, 'min_version', component.version)
         min_version_str = str(min_version)
 
-        # Initialize data structures if needed
-        if name not in self._versions:
-            self._versions[name] = []
+        # Initialize the compatibility row - a new component also resets the cached layout
         if name not in self._compatibility_map:
             self._compatibility_map[name] = {}
+            self._invalidate_layout()
 
-        # Add version if not already registered
-        if version_str not in self._versions[name]:
-            self._versions[name].append(version_str)
+        # Add version if not already registered - one hash probe, order preserved
+        self._versions.setdefault(name, {})[version_str] = None
 
         # Log registration
         logger.debug(f"Registered component {name} v{version_str} (min: v{min_version_str})")
@@ -85,30 +131,25 @@ class CompatibilityMatrix:
     def register_compatibility(self, component1: str, version1: str,
                               component2: str, version2: str) -> None:
         """Register bidirectional compatibility between specific component versions."""
-        # Initialize data structures if needed
-        if component1 not in self._compatibility_map:
-            self._compatibility_map[component1] = {}
-        if component2 not in self._compatibility_map[component1]:
-            self._compatibility_map[component1][component2] = []
-
-        # Record bidirectional compatibility
-        compat_pair = (version1, version2)
-        if compat_pair not in self._compatibility_map[component1][component2]:
-            self._compatibility_map[component1][component2].append(compat_pair)
-
-        # Ensure reverse mapping exists - relationship symmetry is guaranteed
-        if component2 not in self._compatibility_map:
-            self._compatibility_map[component2] = {}
-        if component1 not in self._compatibility_map[component2]:
-            self._compatibility_map[component2][component1] = []
-
-        # Record reverse compatibility
-        reverse_pair = (version2, version1)
-        if reverse_pair not in self._compatibility_map[component2][component1]:
-            self._compatibility_map[component2][component1].append(reverse_pair)
+        component1, component2 = sys.intern(component1), sys.intern(component2)
+        # Record both directions - relationship symmetry is guaranteed
+        self._add_pair(component1, component2, version1, version2)
+        self._add_pair(component2, component1, version2, version1)
 
         logger.debug(f"Registered compatibility: {component1} v{version1} ↔ {component2} v{version2}")
 
+    def _add_pair(self, source: str, target: str, source_version: str, target_version: str) -> None:
+        """Record one directed compatibility pair - re-adding an existing pair is a no-op."""
+        if source not in self._compatibility_map:
+            self._compatibility_map[source] = {}
+            self._invalidate_layout()
+        self._compatibility_map[source].setdefault(target, {}).setdefault(source_version, {})[target_version] = None
+
+    @staticmethod
+    def _pair_count(by_version: Dict[str, Dict[str, None]]) -> int:
+        """Number of version pairs recorded for one component → target relationship."""
+        return sum(map(len, by_version.values()))
+
     def verify_compatibility(self, component1: str, version1: str,
                            component2: str, version2: str) -> bool:
         """
@@ -116,43 +157,32 @@ class CompatibilityMatrix:
 
         Returns false until proven compatible - security through pessimism.
         """
-        # Check if we have direct compatibility data
-        if (component1 in self._compatibility_map and
-            component2 in self._compatibility_map[component1]):
-            for c1_ver, c2_ver in self._compatibility_map[component1][component2]:
-                # Check for exact version match or compatibility based on semver
-                if c1_ver == version1 and c2_ver == version2:
-                    return True
-
-                # For exact match of first component, check if second is compatible
-                if c1_ver == version1:
-                    try:
-                        if is_compatible(version2, c2_ver):
-                            return True
-                    except Exception as e:
-                        logger.debug(f"Compatibility check failed: {e}")
+        # Check if we have direct compatibility data for this exact first version
+        target_versions = self._compatibility_map.get(component1, {}).get(component2, {}).get(version1)
+        if target_versions:
+            # Exact version match is a single dict probe
+            if version2 in target_versions:
+                return True
+
+            # For exact match of first component, check if second is compatible
+            for c2_ver in target_versions:
+                try:
+                    if is_compatible(version2, c2_ver):
+                        return True
+                except Exception as e:
+                    logger.debug(f"Compatibility check failed: {e}")
 
         # If no direct information, assume incompatible - fail closed
         return False
 
     def get_compatible_versions(self, component: str, version: str) -> Dict[str, List[str]]:
         """Get all components/versions compatible with the specified component version."""
-        result: Dict[str, List[str]] = {}
-
-        if component not in self._compatibility_map:
-            return result  # Return empty dictionary for unknown components
-
-        for target_comp, compat_versions in self._compatibility_map[component].items():
-            compatible_versions: List[str] = []
-
-            for comp_ver, target_ver in compat_versions:
-                if comp_ver == version:
-                    compatible_versions.append(target_ver)
-
-            if compatible_versions:
-                result[target_comp] = compatible_versions
-
-        return result
+        # Unknown components yield an empty dictionary
+        return {
+            target_comp: list(by_version[version])
+            for target_comp, by_version in self._compatibility_map.get(component, {}).items()
+            if version in by_version
+        }
 
     def generate_compatibility_report(self) -> Dict[str, Dict[str, Dict[str, List[str]]]]:
         """
@@ -161,23 +191,14 @@ class CompatibilityMatrix:
         Returns a nested dictionary structure mapping components to their
         compatible targets, organized by version.
         """
-        report: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
-
-        for component, targets in self._compatibility_map.items():
-            report[component] = {}
-
-            for target_comp, compat_versions in targets.items():
-                # Group by source version
-                by_version: Dict[str, List[str]] = {}
-
-                for comp_ver, target_ver in compat_versions:
-                    if comp_ver not in by_version:
-                        by_version[comp_ver] = []
-                    by_version[comp_ver].append(target_ver)
-
-                report[component][target_comp] = by_version
-
-        return report
+        # The store is already grouped by source version - copy so callers cannot mutate it
+        return {
+            component: {
+                target_comp: {comp_ver: list(target_vers) for comp_ver, target_vers in by_version.items()}
+                for target_comp, by_version in targets.items()
+            }
+            for component, targets in self._compatibility_map.items()
+        }
 
     def _create_graphical_visualization(self, output_path: Optional[str] = None) -> str:
         """
@@ -194,7 +215,7 @@ class CompatibilityMatrix:
             plt = cast(PyplotProto, plt_dynamic)  # Explicit cast clarifies intent
 
             # Get all unique components
-            components: List[str] = sorted(self._compatibility_map.keys())
+            components: List[str] = self._sorted_components
             n_components: int = len(components)
 
             if n_components == 0:
@@ -203,28 +224,40 @@ class CompatibilityMatrix:
             # Create compatibility matrix
             matrix: FloatingArray = np.zeros((n_components, n_components))
 
-            # Fill matrix with compatibility information
-            for i, comp1 in enumerate(components):
-                for j, comp2 in enumerate(components):
-                    if comp1 == comp2:
-                        matrix[i, j] = 1  # Self-compatible by definition
-                    elif (comp1 in self._compatibility_map and
-                          comp2 in self._compatibility_map[comp1]):
-                        matrix[i, j] = len(self._compatibility_map[comp1][comp2])
+            # Fill matrix from the sparse map only - O(registered pairs), not O(n²)
+            index: Dict[str, int] = {comp: i for i, comp in enumerate(components)}
+            for comp1, targets in self._compatibility_map.items():
+                row = index[comp1]
+                for comp2, by_version in targets.items():
+                    col = index.get(comp2)
+                    if col is not None:
+                        matrix[row, col] = self._pair_count(by_version)
+            np.fill_diagonal(matrix, 1)  # Self-compatible by definition
 
             # Create visualization with elegant styling
             _ = plt.figure(figsize=(10, 8))  # Use _ for unused variable
-            img = plt.matshow(matrix, cmap='Blues')
-            _ = plt.colorbar(mappable=img, label='Number of compatible version pairs')
-
-            # Set component labels with perfect alignment
-            components_seq: Sequence[str] = cast(Sequence[str], components)
-            plt.xticks(range(n_components), components_seq, rotation=90)
-            plt.yticks(range(n_components), components_seq)
+            if n_components <= _FULL_LABEL_LIMIT:
+                img = plt.matshow(matrix, cmap='Blues')
+                _ = plt.colorbar(mappable=img, label='Number of compatible version pairs')
+
+                # Set component labels with perfect alignment
+                components_seq: Sequence[str] = cast(Sequence[str], components)
+                plt.xticks(range(n_components), components_seq, rotation=90)
+                plt.yticks(range(n_components), components_seq)
+            else:
+                # Large matrices: per-label text artists, the colorbar and tight_layout's
+                # text-box solver dominate rendering - draw into the current figure and
+                # label an evenly spaced subset only
+                plt.imshow(matrix, cmap='Blues')
+                ticks = np.linspace(0, n_components - 1, _SAMPLED_TICKS, dtype=int)
+                labels = [components[i] for i in ticks]
+                plt.xticks(ticks, labels, rotation=90)
+                plt.yticks(ticks, labels)
 
             # Add descriptive title
             plt.title('Eidosian Component Compatibility Matrix')
-            plt.tight_layout()
+            if n_components <= _FULL_LABEL_LIMIT:
+                plt.tight_layout()
 
             # Save if output path is provided
             if output_path:
@@ -246,32 +279,38 @@ class CompatibilityMatrix:
 
         When pixels fail, characters prevail - the eternal fallback.
         """
-        components = sorted(self._compatibility_map.keys())
+        components = self._sorted_components
 
         if not components:
             return "No components registered in compatibility matrix. The void stares back."
 
-        # Calculate column width based on longest component name
-        col_width = max(len(comp) for comp in components) + 2
+        # Column width based on longest component name; labels padded once and reused
+        col_width = self._col_width
+        padded = [comp.ljust(col_width) for comp in components]
 
         # Build header row with perfect alignment
-        header = ' ' * col_width + '│ ' + ' '.join(comp.ljust(col_width) for comp in components)
+        header = ' ' * col_width + '│ ' + ' '.join(padded)
         separator = '─' * col_width + '┼' + '─' * (len(header) - col_width - 1)
 
+        # Cell strings are built once per distinct value, not once per cell
+        check = '✓'.center(col_width)  # Self-compatible
+        dot = '·'.center(col_width)  # Empty but visually meaningful
+        counts: Dict[int, str] = {}
+
         # Build rows with relationship indicators
         rows: List[str] = []
-        for comp1 in components:
-            row: List[str] = [comp1.ljust(col_width) + '│']
+        for comp1, label in zip(components, padded):
+            targets = self._compatibility_map[comp1]
+            row: List[str] = [label + '│']
 
             for comp2 in components:
                 if comp1 == comp2:
-                    cell = '✓'.center(col_width)  # Self-compatible
-                elif (comp1 in self._compatibility_map and
-                      comp2 in self._compatibility_map[comp1]):
-                    count = len(self._compatibility_map[comp1][comp2])
-                    cell = (f"{count}").center(col_width)
+                    cell = check
+                elif comp2 in targets:
+                    count = self._pair_count(targets[comp2])
+                    cell = counts.get(count) or counts.setdefault(count, str(count).center(col_width))
                 else:
-                    cell = '·'.center(col_width)  # Empty but visually meaningful
+                    cell = dot
 
                 row.append(cell)
 
@@ -287,10 +326,20 @@ class CompatibilityMatrix:
 
         Structural preservation in transit - data as immutable truth.
         """
-        return json.dumps({
-            "components": self._versions,
-            "compatibility": self._compatibility_map
-        }, indent=2)
+        # Pairs become [version1, version2] lists only at the serialization boundary
+        compatibility = {
+            component: {
+                target_comp: [[comp_ver, target_ver]
+                              for comp_ver, target_vers in by_version.items()
+                              for target_ver in target_vers]
+                for target_comp, by_version in targets.items()
+            }
+            for component, targets in self._compatibility_map.items()
+        }
+        return _dumps_indented({
+            "components": {name: list(versions) for name, versions in self._versions.items()},
+            "compatibility": compatibility
+        })
 
     @classmethod
     def from_json(cls, json_str: str) -> 'CompatibilityMatrix':
@@ -301,13 +350,22 @@ class CompatibilityMatrix:
         """
         matrix = cls()
         try:
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
 
             # Restore version information
-            matrix._versions = data.get("components", {})
-
-            # Restore compatibility mappings
-            matrix._compatibility_map = data.get("compatibility", {})
+            matrix._versions = {name: dict.fromkeys(versions)
+                                for name, versions in data.get("components", {}).items()}
+
+            # Restore compatibility mappings in one streaming pass - serialized data already
+            # holds both directions, and [version1, version2] lists never outlive the load
+            intern = sys.intern
+            for component, targets in data.get("compatibility", {}).items():
+                row = matrix._compatibility_map.setdefault(intern(component), {})
+                for target_comp, compat_pairs in targets.items():
+                    by_version = row.setdefault(intern(target_comp), {})
+                    for comp_ver, target_ver in compat_pairs:
+                        by_version.setdefault(comp_ver, {})[target_ver] = None
+            matrix._invalidate_layout()
 
             logger.debug(f"Restored compatibility matrix with {len(matrix._versions)} components")
             return matrix
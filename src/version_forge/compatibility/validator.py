@@ -5,7 +5,9 @@ Precision-guided dependency graph analysis with strict validation
 for ensuring consistent versioning across the Eidosian ecosystem.
 """
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import sys
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from ..operations.compare import is_compatible
 from ..protocols.interfaces import IVersioned
@@ -25,18 +27,55 @@ class DependencyValidator:
         """Initialize the validator with optional component dictionary"""
         self._components = components or {}
         self._dependencies: Dict[str, Set[str]] = {}
+        # Sorted tuple snapshot of _dependencies for traversal, None until rebuilt after a change
+        self._deps_frozen: Optional[Dict[str, Tuple[str, ...]]] = None
+        # Resolved minimum versions by component name, dropped when a name is re-registered
+        self._min_version_cache: Dict[str, str] = {}
 
     def register_component(self, name: str, component: IVersioned) -> None:
         """Register a component for validation"""
+        name = sys.intern(name)  # Names are probed as dict keys constantly
         self._components[name] = component
-        logger.debug(f"Registered component {name} v{component.version}")
+        self._min_version_cache.pop(name, None)
+        logger.debug("Registered component %s v%s", name, component.version)
 
     def register_dependency(self, dependent: str, dependency: str) -> None:
         """Register a dependency relationship between components"""
+        dependent, dependency = sys.intern(dependent), sys.intern(dependency)
         if dependent not in self._dependencies:
             self._dependencies[dependent] = set()
         self._dependencies[dependent].add(dependency)
-        logger.debug(f"Registered dependency: {dependent} → {dependency}")
+        self._deps_frozen = None
+        logger.debug("Registered dependency: %s → %s", dependent, dependency)
+
+    def register_components(self, components: Mapping[str, IVersioned]) -> None:
+        """Register many components with a single dictionary update"""
+        intern = sys.intern
+        self._components.update((intern(name), component) for name, component in components.items())
+        for name in components:
+            self._min_version_cache.pop(name, None)
+        logger.debug("Registered %d components", len(components))
+
+    def register_dependencies(self, relationships: Iterable[Tuple[str, str]]) -> None:
+        """Register many (dependent, dependency) relationships in one pass"""
+        dependencies = self._dependencies
+        count = 0
+        intern = sys.intern
+        for dependent, dependency in relationships:
+            dependent, dependency = intern(dependent), intern(dependency)
+            if dependent not in dependencies:
+                dependencies[dependent] = set()
+            dependencies[dependent].add(dependency)
+            count += 1
+        self._deps_frozen = None
+        logger.debug("Registered %d dependencies", count)
+
+    def _frozen_dependencies(self) -> Dict[str, Tuple[str, ...]]:
+        """Dependency adjacency as sorted tuples - deterministic order, rebuilt only after registration"""
+        if self._deps_frozen is None:
+            self._deps_frozen = {dependent: tuple(sorted(required))
+                                 for dependent, required in self._dependencies.items()}
+        return self._deps_frozen
 
     def validate_dependency_graph(self) -> Tuple[bool, List[str]]:
         """
@@ -49,13 +88,13 @@ class DependencyValidator:
 
         errors: List[str] = []
 
-        for dependent, dependencies in self._dependencies.items():
+        for dependent, dependencies in self._frozen_dependencies().items():
             if dependent not in self._components:
                 errors.append(f"Component '{dependent}' is not registered but has dependencies")
                 continue
 
             dependent_comp = self._components[dependent]
-            dependent_min_version = self._get_min_version(dependent_comp)
+            dependent_min_version = self._min_version_for(dependent)
 
             for dependency in dependencies:
                 if dependency not in self._components:
@@ -80,8 +119,8 @@ class DependencyValidator:
         """
         Get an ordered upgrade plan to reach target versions.
 
-        Uses topological sorting to determine the correct upgrade order that
-        respects all dependency relationships.
+        Uses iterative topological sorting (Kahn's algorithm) to determine the
+        correct upgrade order that respects all dependency relationships.
 
         Returns a dictionary mapping component names to versions in the order
         they should be upgraded.
@@ -89,53 +128,38 @@ class DependencyValidator:
         if not self._components or not self._dependencies:
             return {}
 
-        # Build dependency graph
-        graph: Dict[str, Set[str]] = {}
-        for dependent, dependencies in self._dependencies.items():
-            if dependent not in graph:
-                graph[dependent] = set()
-            for dependency in dependencies:
-                graph[dependent].add(dependency)
-
-        # Add components without dependencies
-        for component in self._components:
-            if component not in graph:
-                graph[component] = set()
-
-        # Topological sort - resolve dependency order
-        visited: Set[str] = set()
-        temp_visited: Set[str] = set()
-        order: List[str] = []
+        dependencies = self._frozen_dependencies()
 
-        def visit(node: str) -> None:
-            """Recursive topological sort visitor with cycle detection"""
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected involving {node}")
-            if node in visited:
-                return
+        # Every node in the graph: dependents, registered components and bare dependencies
+        nodes: Dict[str, None] = dict.fromkeys(dependencies)
+        nodes.update(dict.fromkeys(self._components))
+        for required in dependencies.values():
+            nodes.update(dict.fromkeys(required))
 
-            temp_visited.add(node)
+        # Kahn's algorithm - a node is ready once all of its dependencies are ordered
+        pending: Dict[str, int] = {node: len(dependencies.get(node, ())) for node in nodes}
+        dependents: Dict[str, List[str]] = {node: [] for node in nodes}
+        for dependent, required in dependencies.items():
+            for dependency in required:
+                dependents[dependency].append(dependent)
 
-            # Visit all dependencies first
-            for dependency in graph.get(node, set()):
-                visit(dependency)
-
-            temp_visited.remove(node)
-            visited.add(node)
+        ready = deque(node for node, count in pending.items() if count == 0)
+        order: List[str] = []
+        while ready:
+            node = ready.popleft()
             order.append(node)
+            for dependent in dependents[node]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
 
-        # Visit all nodes in the graph
-        for node in graph:
-            if node not in visited:
-                visit(node)
+        # Anything left unordered is on, or depends on, a cycle
+        if len(order) != len(nodes):
+            blocked = next(node for node, count in pending.items() if count)
+            raise ValueError(f"Circular dependency detected involving {blocked}")
 
         # Create upgrade plan in correct order
-        plan: Dict[str, str] = {}
-        for component in order:
-            if component in target_versions:
-                plan[component] = target_versions[component]
-
-        return plan
+        return {component: target_versions[component] for component in order if component in target_versions}
 
     def find_compatible_version(self, component: str, dependency: str) -> Optional[str]:
         """
@@ -146,10 +170,9 @@ class DependencyValidator:
         if component not in self._components or dependency not in self._components:
             return None
 
-        component_comp = self._components[component]
         dependency_comp = self._components[dependency]
 
-        component_min_version = self._get_min_version(component_comp)
+        component_min_version = self._min_version_for(component)
         dependency_version = str(dependency_comp.version)
 
         # Check if current versions are compatible
@@ -159,6 +182,14 @@ class DependencyValidator:
         # Future enhancement: search registry for other available versions
         return None
 
+    def _min_version_for(self, name: str) -> str:
+        """Minimum version requirement of a registered component, resolved once per registration."""
+        try:
+            return self._min_version_cache[name]
+        except KeyError:
+            min_version = self._min_version_cache[name] = self._get_min_version(self._components[name])
+            return min_version
+
     def _get_min_version(self, component: IVersioned) -> str:
         """
         Extract minimum version requirement from a component.
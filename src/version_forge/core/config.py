@@ -6,7 +6,7 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Final
+from typing import Any, Dict, Final, Optional
 
 from ..protocols.interfaces import ConfigSource
 
@@ -23,6 +23,9 @@ CENTRAL_VERSIONS_PATH: Final[Path] = Path(os.environ.get(
     "CENTRAL_VERSIONS_PATH", str(EIDOSIAN_ROOT / "central_versions.json")
 ))
 
+# Leading numeric triple of a version string - compiled once for every sync
+_SEMVER3_RE: Final["re.Pattern[str]"] = re.compile(r'^(\d+)\.(\d+)\.(\d+)')
+
 @dataclass
 class VersionConfig:
     """Version configuration with bidirectional synchronization"""
@@ -34,13 +37,22 @@ class VersionConfig:
     patch: int = field(default=0, init=False)
     source: ConfigSource = "defaults"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field and invalidate the memoized dictionary form"""
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+
     def __post_init__(self) -> None:
         """Initialize computed fields after direct initialization"""
+        # Memoized to_dict payload - a plain attribute, not a field, so it stays out of
+        # fields()/asdict(); any field assignment drops it
+        self._cached_dict: Optional[Dict[str, Any]] = None
         self._sync_from_version()
 
     def _sync_from_version(self) -> None:
         """Extract semantic components from version string"""
-        if match := re.match(r'^(\d+)\.(\d+)\.(\d+)', self.__version__):
+        if match := _SEMVER3_RE.match(self.__version__):
             self.major, self.minor, self.patch = map(int, match.groups())
 
     def update(self, **kwargs: Any) -> None:
@@ -57,13 +69,15 @@ class VersionConfig:
             self.__version__ = f"{self.major}.{self.minor}.{self.patch}"
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation"""
-        return {
-            "version": self.__version__,
-            "min_version": self.min_version,
-            "release_date": self.release_date,
-            "major": self.major,
-            "minor": self.minor,
-            "patch": self.patch,
-            "source": self.source
-        }
+        """Convert to dictionary representation (a fresh copy of the memoized payload)"""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "version": self.__version__,
+                "min_version": self.min_version,
+                "release_date": self.release_date,
+                "major": self.major,
+                "minor": self.minor,
+                "patch": self.patch,
+                "source": self.source
+            }
+        return self._cached_dict.copy()
@@ -4,75 +4,95 @@ Provides robust semantic version handling with flexible parsing strategies.
 """
 import logging
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Final, Optional, Tuple
 
 from ..protocols.interfaces import VersionProtocol
 
+# Preferred parser when available - import attempted once, not per call
+try:
+    from packaging.version import parse as _packaging_parse
+except ImportError:
+    _packaging_parse = None  # type: ignore[assignment]
+
 logger = logging.getLogger("forge.version")
 
+# Compiled once at import - every SimpleVersion construction goes through it
+_VERSION_PATTERN: Final["re.Pattern[str]"] = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:[-.]?(.+))?$')
+
+# Bare "X.Y.Z" - packaging would yield the same release triple with no prerelease
+_PLAIN_TRIPLE: Final["re.Pattern[str]"] = re.compile(r'[0-9]+\.[0-9]+\.[0-9]+')
+
+@lru_cache(maxsize=2048)
+def _parse_semver(version_str: str) -> Optional[Tuple[int, int, int, Optional[str]]]:
+    """Split version string into (major, minor, patch, prerelease), None when invalid"""
+    if match := _VERSION_PATTERN.match(version_str):
+        return int(match.group(1)), int(match.group(2)), int(match.group(3)), match.group(4) or None
+    return None
+
 class SimpleVersion:
     """Semantic version with numerical precision and lexical comparison"""
-    __slots__ = ("major", "minor", "patch", "micro", "prerelease", "_valid")
+    __slots__ = ("major", "minor", "patch", "prerelease", "_valid", "_key")
 
     def __init__(self, version_str: str) -> None:
         self.major: int = 0
         self.minor: int = 0
         self.patch: int = 0
-        self.micro: int = 0  # Alias for patch to maintain API compatibility
         self.prerelease: Optional[str] = None
         self._valid: bool = self._parse(version_str)
+        self._refresh_key()
 
     def _parse(self, version_str: str) -> bool:
         """Parse version string with component extraction"""
-        if match := re.match(r'^(\d+)\.(\d+)\.(\d+)(?:[-.]?(.+))?$', version_str):
-            self.major, self.minor = int(match.group(1)), int(match.group(2))
-            self.patch = self.micro = int(match.group(3))  # synchronize patch/micro
-            self.prerelease = match.group(4) or None
-            return True
-        return False
-
+        if (parsed := _parse_semver(version_str)) is None:
+            return False
+        self.major, self.minor, self.patch, self.prerelease = parsed
+        return True
+
+    @property
+    def micro(self) -> int:
+        """Alias for patch to maintain API compatibility - always in sync, no extra slot"""
+        return self.patch
+
+    def _refresh_key(self) -> None:
+        """Recompute the ordering key - call after mutating any component in place
+
+        Prerelease sorts as (1,) when absent and (0, text) when present, so a
+        release outranks every prerelease and prereleases compare lexically.
+        """
+        self._key: Tuple[int, int, int, Tuple[Any, ...]] = (
+            self.major, self.minor, self.patch,
+            (1,) if self.prerelease is None else (0, self.prerelease),
+        )
+
+    # Every comparison is a single C-level tuple compare on the cached key
     def __lt__(self, other: Any) -> bool:
         """Compare versions: 1.0.0 < 2.0.0 and 1.0.0 > 1.0.0-alpha"""
         if not isinstance(other, SimpleVersion):
             return NotImplemented
-
-        # Short-circuit numeric comparisons for efficiency
-        for s, o in zip((self.major, self.minor, self.patch),
-                       (other.major, other.minor, other.patch)):
-            if s != o:
-                return s < o
-
-        # Prerelease logic: absent > present, or lexical comparison
-        if self.prerelease is None:
-            return False  # No prerelease is "greater than" any prerelease
-        if other.prerelease is None:
-            return True   # Any prerelease is "less than" no prerelease
-        return self.prerelease < other.prerelease  # Lexical comparison
+        return self._key < other._key
 
     def __eq__(self, other: Any) -> bool:
         """Versions equal when all components match exactly"""
         if not isinstance(other, SimpleVersion):
             return NotImplemented
-        return ((self.major, self.minor, self.patch, self.prerelease) ==
-                (other.major, other.minor, other.patch, other.prerelease))
+        return self._key == other._key
 
-    # Derived comparison operators through mathematical composition
     def __gt__(self, other: Any) -> bool:
-        lt_result = self.__lt__(other)
-        return NotImplemented if lt_result is NotImplemented else not (lt_result or self.__eq__(other))
+        if not isinstance(other, SimpleVersion):
+            return NotImplemented
+        return self._key > other._key
 
     def __ge__(self, other: Any) -> bool:
-        lt_result = self.__lt__(other)
-        return NotImplemented if lt_result is NotImplemented else not lt_result
+        if not isinstance(other, SimpleVersion):
+            return NotImplemented
+        return self._key >= other._key
 
     def __le__(self, other: Any) -> bool:
         """Less than or equal to comparison"""
-        eq_result = self.__eq__(other)
-        if eq_result is NotImplemented:
+        if not isinstance(other, SimpleVersion):
             return NotImplemented
-        if eq_result:
-            return True
-        return self.__lt__(other)
+        return self._key <= other._key
 
     def __str__(self) -> str:
         """String representation"""
@@ -87,21 +107,25 @@ class SimpleVersion:
 
     def __hash__(self) -> int:
         """Hash based on version components for dictionary use"""
-        return hash((self.major, self.minor, self.patch, self.prerelease))
+        return hash(self._key)
 
 
 def parse_version(version_str: str, fallback_to_simple: bool = True) -> VersionProtocol:
     """Parse version string with optimal strategy selection"""
-    # Normalize input for consistent results
-    cleaned: str = re.sub(r'^[vV]', '', version_str.strip())
+    # Normalize input for consistent results - drop a single v/V prefix without regex
+    cleaned: str = version_str.strip()
+    if cleaned[:1] in ("v", "V"):
+        cleaned = cleaned[1:]
+
+    if _packaging_parse is None or _PLAIN_TRIPLE.fullmatch(cleaned):
+        # Self-contained path: no external dependency, and no packaging round trip
+        # for the plain numeric triple that dominates real inputs
+        return SimpleVersion(cleaned)
 
     # Strategy cascade with graceful degradation
     try:
-        # Preferred implementation when available
-        from packaging.version import parse as packaging_parse
-
         # Create adapter to ensure protocol compliance
-        pkg_ver = packaging_parse(cleaned)
+        pkg_ver = _packaging_parse(cleaned)
         if hasattr(pkg_ver, 'release'):
             # Convert packaging.Version to SimpleVersion for protocol compliance
             release = pkg_ver.release
@@ -109,13 +133,11 @@ def parse_version(version_str: str, fallback_to_simple: bool = True) -> VersionP
             # Copy additional attributes for compatibility
             if hasattr(pkg_ver, 'pre') and pkg_ver.pre:
                 ver.prerelease = '.'.join(str(x) for x in pkg_ver.pre)
+                ver._refresh_key()
             return ver
 
         # Fallback for unexpected version types
         return SimpleVersion(cleaned)
-    except ImportError:
-        # Self-contained fallback requires no external dependencies
-        return SimpleVersion(cleaned)
     except Exception as e:
         # Controlled failure with explicit instruction
         if not fallback_to_simple:
@@ -124,20 +146,29 @@ def parse_version(version_str: str, fallback_to_simple: bool = True) -> VersionP
         return SimpleVersion(cleaned)
 
 
+# Shared-instance parse cache for read-only callers (comparison helpers) - results must not be mutated
+_parse_cached = lru_cache(maxsize=1024)(parse_version)
+
+
 DEFAULT_VERSION = "0.1.0"
+_DEFAULT_FORMATTED: Final[str] = f"v{DEFAULT_VERSION}"
+
 
+@lru_cache(maxsize=256)
+def _format_version_str(version: str) -> str:
+    """Canonical v-prefixed form of a version string - memoized for repeat callers"""
+    return f"v{version.lstrip('vV')}"
 
 def format_version(version: Any) -> str:
     """Convert any version to canonical form with v-prefix"""
+    if isinstance(version, str):
+        return _format_version_str(version)
     try:
-        if isinstance(version, str):
-            return f"v{version.lstrip('vV')}"
-        elif hasattr(version, '__version__'):
-            return f"v{getattr(version, '__version__').lstrip('vV')}"
-        elif hasattr(version, 'version'):
-            return f"v{getattr(version, 'version').lstrip('vV')}"
-        else:
-            return f"v{str(version).lstrip('vV')}"
+        # Single lookup chain: __version__, then version, then the object itself
+        value = getattr(version, '__version__', None)
+        if value is None:
+            value = getattr(version, 'version', version)
+        return _format_version_str(str(value))
     except Exception as e:
         logger.debug(f"Format error: {e}")
-        return f"v{DEFAULT_VERSION}"
+        return _DEFAULT_FORMATTED
@@ -1,13 +1,16 @@
 """
 Version operations for comparison, validation, and manipulation.
 """
-from .compare import calculate_delta, is_compatible
+from .compare import (calculate_delta, calculate_delta_parsed, is_compatible,
+                      is_compatible_parsed)
 from .migration import MigrationGuideGenerator
 from .update import update_version
 
 __all__ = [
     'calculate_delta',
+    'calculate_delta_parsed',
     'is_compatible',
+    'is_compatible_parsed',
     'update_version',
     'MigrationGuideGenerator',
 ]
@@ -2,58 +2,123 @@
 Version comparison operations with semantic accuracy.
 """
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
-from ..core.version import parse_version
+from ..core.version import SimpleVersion, _parse_cached
 from ..protocols.interfaces import VersionDelta, VersionProtocol
 
 logger = logging.getLogger("forge.version")
 
-def calculate_delta(v1: str, v2: str) -> VersionDelta:
-    """Calculate precise semantic distance between versions"""
+def _empty_delta() -> VersionDelta:
+    """Valid VersionDelta structure for failed calculations (no error field)"""
+    return {
+        "major": 0, "minor": 0, "patch": 0,
+        "is_upgrade": False, "is_downgrade": False,
+        "is_same": False
+    }
+
+def _delta_between(ver1: VersionProtocol, ver2: VersionProtocol) -> VersionDelta:
+    """Semantic distance between parsed versions - no error handling, callers guard it"""
+    # Extract components safely regardless of version implementation
+    major1: Any | int = getattr(ver1, 'major', 0)
+    major2: Any | int = getattr(ver2, 'major', 0)
+    minor1: Any | int = getattr(ver1, 'minor', 0)
+    minor2: Any | int = getattr(ver2, 'minor', 0)
+    patch1: Any | int = getattr(ver1, 'patch', getattr(ver1, 'micro', 0))
+    patch2: Any | int = getattr(ver2, 'patch', getattr(ver2, 'micro', 0))
+
+    major, minor, patch = major2 - major1, minor2 - minor1, patch2 - patch1
+
+    # The first non-zero component already decides direction - only a full
+    # numeric tie needs protocol comparisons (prerelease ordering)
+    step = major or minor or patch
+    if step:
+        is_upgrade, is_downgrade, is_same = step > 0, step < 0, False
+    elif isinstance(ver1, SimpleVersion) and isinstance(ver2, SimpleVersion):
+        # Prerelease-ranked ordering keys compared directly - C-level tuple compares,
+        # no per-operator method dispatch
+        key1, key2 = ver1._key, ver2._key
+        is_upgrade, is_downgrade = key2 > key1, key2 < key1
+        is_same = not (is_upgrade or is_downgrade)
+    else:
+        is_upgrade, is_downgrade, is_same = ver2 > ver1, ver2 < ver1, ver2 == ver1
+
+    delta: VersionDelta = {
+        "major": major,
+        "minor": minor,
+        "patch": patch,
+        "is_upgrade": is_upgrade,
+        "is_downgrade": is_downgrade,
+        "is_same": is_same
+    }
+    return delta
+
+def calculate_delta_parsed(ver1: VersionProtocol, ver2: VersionProtocol) -> VersionDelta:
+    """Calculate semantic distance between already-parsed versions"""
     try:
-        ver1, ver2 = parse_version(v1), parse_version(v2)
-        # Extract components safely regardless of version implementation
-        major1: Any | int = getattr(ver1, 'major', 0)
-        major2: Any | int = getattr(ver2, 'major', 0)
-        minor1: Any | int = getattr(ver1, 'minor', 0)
-        minor2: Any | int = getattr(ver2, 'minor', 0)
-        patch1: Any | int = getattr(ver1, 'patch', getattr(ver1, 'micro', 0))
-        patch2: Any | int = getattr(ver2, 'patch', getattr(ver2, 'micro', 0))
-
-        delta: VersionDelta = {
-            "major": major2 - major1,
-            "minor": minor2 - minor1,
-            "patch": patch2 - patch1,
-            "is_upgrade": ver2 > ver1,
-            "is_downgrade": ver2 < ver1,
-            "is_same": ver2 == ver1
-        }
-        return delta
+        # Arbitrary protocol implementations may not support arithmetic or ordering
+        return _delta_between(ver1, ver2)
     except Exception as e:
         # Graceful error handling with explicit indication
         logger.debug(f"Version delta calculation failed: {e}")
-        # Return valid VersionDelta structure without error field
-        delta: VersionDelta = {
-            "major": 0, "minor": 0, "patch": 0,
-            "is_upgrade": False, "is_downgrade": False,
-            "is_same": False
-        }
-        return delta
+        return _empty_delta()
+
+@lru_cache(maxsize=1024)
+def _cached_delta(v1: str, v2: str) -> VersionDelta:
+    """Memoized delta for a version string pair - never handed out directly"""
+    try:
+        ver1, ver2 = _parse_cached(v1), _parse_cached(v2)
+    except Exception as e:
+        logger.debug(f"Version delta calculation failed: {e}")
+        return _empty_delta()
+    # Parsing only ever yields SimpleVersion, whose int components and key ordering cannot fail
+    return _delta_between(ver1, ver2)
+
+def calculate_delta(v1: str, v2: str) -> VersionDelta:
+    """Calculate precise semantic distance between versions"""
+    try:
+        # Shallow copy keeps cache entries immune to caller mutation
+        return _cached_delta(v1, v2).copy()
+    except TypeError as e:
+        # Unhashable input never reaches the cache - it degrades like any bad version
+        logger.debug(f"Version delta calculation failed: {e}")
+        return _empty_delta()
 
 # API stability through semantic aliasing
 calculate_version_delta = calculate_delta
 
 
-def is_compatible(version: str, minimum: Optional[str] = None,
-                  config_min_version: Optional[str] = None) -> bool:
-    """Check version compatibility - false until proven compatible"""
+def is_compatible_parsed(version: VersionProtocol, minimum: VersionProtocol) -> bool:
+    """Check compatibility of already-parsed versions - false until proven compatible"""
     try:
-        minimum_version: str = minimum or config_min_version or "0.1.0"
-        ver1: VersionProtocol = parse_version(version)
-        ver2: VersionProtocol = parse_version(minimum_version)
         # Using only protocol-guaranteed methods: not less than = greater than or equal to
-        return not (ver1 < ver2) or (ver1 == ver2)
+        # (a version that is not less than the minimum needs no separate equality check)
+        return not (version < minimum)
+    except Exception as e:
+        logger.debug(f"Compatibility check failed: {e}")
+        return False  # When uncertain, assume incompatible
+
+@lru_cache(maxsize=4096)
+def _cached_compatible(version: str, minimum_version: str) -> bool:
+    """Memoized compatibility for a version string pair"""
+    try:
+        ver1: VersionProtocol = _parse_cached(version)
+        ver2: VersionProtocol = _parse_cached(minimum_version)
     except Exception as e:
         logger.debug(f"Compatibility check failed: {e}")
         return False  # When uncertain, assume incompatible
+    return is_compatible_parsed(ver1, ver2)
+
+def is_compatible(version: str, minimum: Optional[str] = None,
+                  config_min_version: Optional[str] = None) -> bool:
+    """Check version compatibility - false until proven compatible
+
+    Memoized: validator and matrix loops re-check the same string pairs constantly.
+    """
+    try:
+        return _cached_compatible(version, minimum or config_min_version or "0.1.0")
+    except TypeError as e:
+        # Unhashable input never reaches the cache - it degrades like any bad version
+        logger.debug(f"Compatibility check failed: {e}")
+        return False
@@ -2,13 +2,38 @@
 Version migration guide generation with semantic understanding.
 """
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, Final, Iterable, List, Tuple, TypedDict
 
 from ..operations.compare import calculate_delta
 from ..protocols.interfaces import VersionDelta
 
 logger = logging.getLogger("forge.version")
 
+# Canonical suggestion sets, shared across every guide instead of rebuilt per call
+_UPGRADE_SUGGESTIONS: Final[Dict[str, Tuple[str, ...]]] = {
+    "major_upgrade": (
+        "Review all APIs for breaking changes",
+        "Update tests to account for new behaviors",
+        "Consider a phased migration approach",
+    ),
+    "minor_upgrade": (
+        "Check documentation for new features",
+        "Look for deprecated features you might be using",
+    ),
+    "patch_upgrade": (
+        "Review bug fixes to see if they impact your usage",
+    ),
+}
+
+# Component-name prefix → suggestion template (formatted with the component name), first match wins
+_COMPONENT_SUGGESTIONS: Final[Dict[str, str]] = {
+    "api": "Check for API endpoint changes in {}",
+    "ui": "Review UI component changes in {}",
+    "core": "Test core functionality affected by {} changes",
+}
+
+_BREAKING_SUGGESTION: Final[str] = "Address all breaking changes listed above"
+
 class MigrationGuide(TypedDict):
     """Type definition for migration guide structure."""
     component: str
@@ -27,6 +52,8 @@ class MigrationGuideGenerator:
 
     def __init__(self) -> None:
         self._known_migrations: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Generated guides per component, keyed by (from, to) - dropped when the component registers info
+        self._guide_cache: Dict[str, Dict[Tuple[str, str], MigrationGuide]] = {}
 
     def register_migration_info(self, component: str, from_version: str, to_version: str,
                               breaking_changes: List[str],
@@ -45,45 +72,88 @@ class MigrationGuideGenerator:
             "new_features": new_features,
             "deprecations": deprecations
         }
+        self._guide_cache.pop(component, None)
 
     def generate_migration_guide(self, component: str, from_version: str,
                                to_version: str) -> MigrationGuide:
         """Generate a migration guide between versions"""
-        # Calculate version difference
-        delta = calculate_delta(from_version, to_version)
-
+        component_cache = self._guide_cache.setdefault(component, {})
+        cached = component_cache.get((from_version, to_version))
+        if cached is None:
+            # Calculate version difference
+            cached = self._build_guide(component, from_version, to_version,
+                                       calculate_delta(from_version, to_version))
+            component_cache[(from_version, to_version)] = cached
+        return self._copy_guide(cached)
+
+    def generate_migration_guides(self,
+                                  transitions: Iterable[Tuple[str, str, str]]) -> List[MigrationGuide]:
+        """Generate guides for many (component, from_version, to_version) transitions
+
+        Repeated version pairs are diffed once through calculate_delta's own cache,
+        and repeated transitions come straight from the guide cache.
+        """
+        guides: List[MigrationGuide] = []
+        for component, from_version, to_version in transitions:
+            pair = (from_version, to_version)
+            component_cache = self._guide_cache.setdefault(component, {})
+            cached = component_cache.get(pair)
+            if cached is None:
+                cached = component_cache[pair] = self._build_guide(
+                    component, from_version, to_version, calculate_delta(from_version, to_version))
+            guides.append(self._copy_guide(cached))
+        return guides
+
+    def _build_guide(self, component: str, from_version: str, to_version: str,
+                     delta: VersionDelta) -> MigrationGuide:
+        """Assemble a guide for one transition from its precomputed delta"""
         # Look up any known migration information
         key = f"{from_version}_to_{to_version}"
         known_info = self._known_migrations.get(component, {}).get(key, {})
 
+        # Classified once - suggestions key off the same result
+        upgrade_type = self._determine_upgrade_type(delta)
+
         # Build migration guide with explicit type annotation
         guide: MigrationGuide = {
             "component": component,
             "from_version": from_version,
             "to_version": to_version,
             "version_delta": delta,
-            "upgrade_type": self._determine_upgrade_type(delta),
+            "upgrade_type": upgrade_type,
             "estimated_effort": self._estimate_effort(delta, known_info),
             "breaking_changes": known_info.get("breaking_changes", []),
             "new_features": known_info.get("new_features", []),
             "deprecations": known_info.get("deprecations", []),
-            "suggestions": self._generate_suggestions(component, delta, known_info),
+            "suggestions": self._generate_suggestions(component, delta, known_info, upgrade_type),
         }
-
         return guide
 
+    @staticmethod
+    def _copy_guide(guide: MigrationGuide) -> MigrationGuide:
+        """Copy the per-call parts of a cached guide so callers never mutate the cache
+
+        Known-change lists are shared with the registered migration info, as they
+        always have been; the delta and suggestions were fresh per call and stay so.
+        """
+        copied = guide.copy()
+        copied["version_delta"] = guide["version_delta"].copy()
+        copied["suggestions"] = list(guide["suggestions"])
+        return copied
+
     def _determine_upgrade_type(self, delta: VersionDelta) -> str:
         """Classify the type of upgrade based on semantic versioning rules"""
-        if not delta.get("is_upgrade", False):
-            if delta.get("is_same", False):
+        # Every delta from compare carries all keys - plain subscripts, no .get calls
+        if not delta["is_upgrade"]:
+            if delta["is_same"]:
                 return "no_change"
             return "downgrade"
 
-        if delta.get("major", 0) > 0:
+        if delta["major"] > 0:
             return "major_upgrade"
-        elif delta.get("minor", 0) > 0:
+        elif delta["minor"] > 0:
             return "minor_upgrade"
-        elif delta.get("patch", 0) > 0:
+        elif delta["patch"] > 0:
             return "patch_upgrade"
         return "unknown"
 
@@ -99,46 +169,37 @@ class MigrationGuideGenerator:
             return "low"
 
         # Otherwise estimate based on version numbers
-        if delta.get("major", 0) > 1:
+        major = delta["major"]
+        minor = delta["minor"]
+        if major > 1:
             return "very_high"
-        elif delta.get("major", 0) == 1:
+        elif major == 1:
             return "high"
-        elif delta.get("minor", 0) > 5:
+        elif minor > 5:
             return "medium_high"
-        elif delta.get("minor", 0) > 0:
+        elif minor > 0:
             return "medium"
         return "low"
 
     def _generate_suggestions(self, component: str,
                             delta: VersionDelta,
-                            known_info: Dict[str, Any]) -> List[str]:
-        """Generate helpful migration suggestions"""
+                            known_info: Dict[str, Any],
+                            upgrade_type: str) -> List[str]:
+        """Generate helpful migration suggestions for an already-classified upgrade"""
         suggestions: List[str] = []
 
-        # Basic suggestions based on semantic versioning
-        upgrade_type = self._determine_upgrade_type(delta)
-
-        # Component-specific suggestions based on component type
-        if component.lower().startswith("api"):
-            suggestions.append(f"Check for API endpoint changes in {component}")
-        elif component.lower().startswith("ui"):
-            suggestions.append(f"Review UI component changes in {component}")
-        elif component.lower().startswith("core"):
-            suggestions.append(f"Test core functionality affected by {component} changes")
+        # Component-specific suggestions based on component type - lowercased once
+        component_lc = component.lower()
+        for prefix, template in _COMPONENT_SUGGESTIONS.items():
+            if component_lc.startswith(prefix):
+                suggestions.append(template.format(component))
+                break
 
         # General suggestions based on upgrade type
-        if upgrade_type == "major_upgrade":
-            suggestions.append("Review all APIs for breaking changes")
-            suggestions.append("Update tests to account for new behaviors")
-            suggestions.append("Consider a phased migration approach")
-        elif upgrade_type == "minor_upgrade":
-            suggestions.append("Check documentation for new features")
-            suggestions.append("Look for deprecated features you might be using")
-        elif upgrade_type == "patch_upgrade":
-            suggestions.append("Review bug fixes to see if they impact your usage")
+        suggestions.extend(_UPGRADE_SUGGESTIONS.get(upgrade_type, ()))
 
         # Add specific suggestions if we have known info
         if known_info and known_info.get("breaking_changes"):
-            suggestions.append("Address all breaking changes listed above")
+            suggestions.append(_BREAKING_SUGGESTION)
 
         return suggestions
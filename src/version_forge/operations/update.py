@@ -2,15 +2,28 @@
 Version update operations with file system integration.
 """
 import logging
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, TypedDict
+from time import perf_counter
+from typing import Dict, Final, List, Optional, Tuple, TypedDict, cast
 
 from ..core.config import VersionConfig
 
 logger = logging.getLogger("forge.version")
 
+# Below this many candidate files a thread pool costs more than it saves
+_PARALLEL_MIN_FILES: Final[int] = 32
+
+# Every component pattern starts with this literal
+_COMPONENT_NEEDLE: Final[bytes] = b"VERSION_"
+
+# Text files that may carry version references - a tuple so one str.endswith checks them all
+_VALID_SUFFIXES: Final[Tuple[str, ...]] = (
+    ".py", ".md", ".rst", ".txt", ".toml", ".yaml", ".yml", ".cfg"
+)
+
 class CompleteVersionUpdateResult(TypedDict):
     """Extended version update result with version reference information."""
     updated: bool
@@ -25,7 +38,7 @@ def update_version(new_version: str,
                    repo_path: Optional[Path] = None,
                    config: Optional[VersionConfig] = None) -> CompleteVersionUpdateResult:
     """Update version references throughout codebase with surgical precision."""
-    start_time: datetime = datetime.now()
+    start_time: float = perf_counter()
     repo_root: Path = repo_path or Path.cwd()
 
     # Fast path for no-op updates - avoid unnecessary file operations
@@ -51,73 +64,114 @@ def update_version(new_version: str,
     if config:
         current_major, current_minor, current_patch = config.major, config.minor, config.patch
 
-    files_updated: List[str] = []
-    files_examined: int = 0
-
-    # Surgical replacement patterns with capture groups for precise changes
-    version_patterns: List[Tuple[str, str]] = [
-        (rf'(version\s*=\s*["\']){re.escape(current_version)}(["\'])',
-         rf'\g<1>{new_version}\g<2>'),
-        (rf'(__version__\s*=\s*["\']){re.escape(current_version)}(["\'])',
-         rf'\g<1>{new_version}\g<2>'),
-        (rf'(VERSION_MAJOR\s*=\s*){current_major}',
-         rf'\g<1>{new_major}'),
-        (rf'(VERSION_MINOR\s*=\s*){current_minor}',
-         rf'\g<1>{new_minor}'),
-        (rf'(VERSION_PATCH\s*=\s*){current_patch}',
-         rf'\g<1>{new_patch}'),
+    # Surgical replacement patterns: (prefix to keep, value to replace, replacement value)
+    quoted_version: str = rf'{re.escape(current_version)}(?=["\'])'
+    version_patterns: List[Tuple[str, str, str]] = [
+        (r'version\s*=\s*["\']', quoted_version, new_version),
+        (r'__version__\s*=\s*["\']', quoted_version, new_version),
+        (r'VERSION_MAJOR\s*=\s*', str(current_major), str(new_major)),
+        (r'VERSION_MINOR\s*=\s*', str(current_minor), str(new_minor)),
+        (r'VERSION_PATCH\s*=\s*', str(current_patch), str(new_patch)),
     ]
 
+    # Fused into one alternation compiled once - each file is scanned in a single pass,
+    # and the named prefix group that matched selects the replacement. Compiled as bytes
+    # so file contents are never decoded unless something actually changes
+    fused_pattern: re.Pattern[bytes] = re.compile('|'.join(
+        f'(?P<p{i}>{prefix}){value}' for i, (prefix, value, _) in enumerate(version_patterns)
+    ).encode("utf-8"))
+    replacements: Dict[str, bytes] = {
+        f'p{i}': new.encode("utf-8") for i, (_, _, new) in enumerate(version_patterns)
+    }
+
+    # A match needs either the current version literal (quoted patterns) or a component
+    # constant - files with neither are ruled out by a C-level substring scan
+    needles: Tuple[bytes, ...] = (current_version.encode("utf-8"), _COMPONENT_NEEDLE)
+
+    def substitute(match: "re.Match[bytes]") -> bytes:
+        """Keep the matched prefix and swap in the replacement for its alternative"""
+        prefix_group = cast(str, match.lastgroup)
+        return match.group(prefix_group) + replacements[prefix_group]
+
     # Exclusion rules for efficiency and safety
     skip_dirs: set[str] = {
         "__pycache__", "dist", "build", "venv", ".venv",
         ".git", "node_modules"
     }
-    valid_extensions: set[str] = {
-        ".py", ".md", ".rst", ".txt", ".toml", ".yaml", ".yml", ".cfg"
-    }
 
-    def update_file(path: Path) -> bool:
-        """Update version references in a file, return True if changed"""
-        nonlocal files_examined
-        files_examined += 1
+    def update_file(path: Path) -> Optional[str]:
+        """Update version references in a file, return its repo-relative path if changed
 
+        Touches no shared state, so it can run on worker threads.
+        """
         try:
-            content: str = path.read_text(encoding="utf-8")
-            new_content: str = content
-
-            for pattern, replacement in version_patterns:
-                new_content = re.sub(pattern, replacement, new_content)
-
-            # Idempotent write - only modify when necessary
-            if new_content != content:
-                path.write_text(new_content, encoding="utf-8")
-                files_updated.append(str(path.relative_to(repo_root)))
-                return True
-            return False
+            content: bytes = path.read_bytes()
+            # C-level substring scan rules out most files before any regex work
+            if not any(needle in content for needle in needles):
+                return None
+            new_content, replaced = fused_pattern.subn(substitute, content)
+
+            # Idempotent write - a zero substitution count skips the full-content comparison;
+            # the comparison stays for unchanged components (e.g. VERSION_MAJOR 0 → 0)
+            if replaced and new_content != content:
+                # Only UTF-8 text is ever rewritten - validated here, on the rare changed file
+                content.decode("utf-8")
+                path.write_bytes(new_content)
+                logger.debug("Rewrote %d version reference(s) in %s", replaced, path)
+                return str(path.relative_to(repo_root))
+            return None
         except Exception as e:
             logger.debug(f"Failed updating {path}: {e}")
-            return False
-
-    # Process files with efficient filtering
-    for file_path in repo_root.rglob('*'):
-        # Fast-path exclusions first to minimize work
-        if (file_path.is_dir() or
-            file_path.name.startswith('.') or
-            any(p in file_path.parts for p in skip_dirs)):
+            return None
+
+    # Collect candidates with efficient filtering - one scandir per directory, excluded
+    # directories pruned before descent, no symlinked directory traversal
+    candidates: List[Path] = []
+    pending: List[str] = [os.fspath(repo_root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            scanner = os.scandir(directory)
+        except OSError as e:
+            # Unreadable directories are skipped, never fatal to the whole update
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
             continue
-
-        # Process only relevant file types
-        if file_path.suffix.lower() in valid_extensions:
-            update_file(file_path)
+        with scanner as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in skip_dirs:
+                        pending.append(entry.path)
+                    continue
+
+                # Fast-path exclusions first to minimize work
+                if name.startswith('.') or name in skip_dirs or entry.is_dir():
+                    continue
+
+                # Process only relevant file types
+                if name.lower().endswith(_VALID_SUFFIXES):
+                    candidates.append(Path(entry.path))
+
+    # Read/write syscalls release the GIL, so larger trees fan out across threads;
+    # results come back in walk order and are aggregated here without locks
+    results: List[Optional[str]]
+    if len(candidates) >= _PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = list(executor.map(update_file, candidates))
+    else:
+        results = [update_file(path) for path in candidates]
+    files_examined: int = len(candidates)
 
     # Special handling for critical configuration files
     pyproject_path = repo_root / "pyproject.toml"
     if pyproject_path.exists():
-        update_file(pyproject_path)
+        results.append(update_file(pyproject_path))
+        files_examined += 1
+
+    files_updated: List[str] = [rel for rel in results if rel is not None]
 
     # Calculate operation duration for metrics
-    duration: float = (datetime.now() - start_time).total_seconds()
+    duration: float = perf_counter() - start_time
 
     # Update runtime state for consistency
     if files_updated and config:
@@ -78,5 +78,3 @@ class VersionStatus(TypedDict):
     version_source: str
     module_path: str
     system_info: Dict[str, str]
-    module_path: str
-    system_info: Dict[str, str]